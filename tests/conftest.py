@@ -10,6 +10,53 @@ ONEHOUR = timedelta(hours=1)
 HALFHOUR = timedelta(minutes=30)
 ONEMIN = timedelta(minutes=1)
 
+BENCHMARK_RESULTS = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks", "benchmarks (run with -m stress)")
+    group.addoption(
+        "--benchmark-sizes",
+        default="1e3,1e5",
+        help="comma-separated numbers of points to benchmark, e.g. '1e3,1e7'.",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=1.5,
+        help="ratio to the baseline above which a benchmark fails.",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="store the results as the new baseline instead of comparing.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "benchmark_size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--benchmark-sizes").split(",")
+        metafunc.parametrize("benchmark_size", [int(float(size)) for size in sizes])
+
+
+def pytest_configure(config):
+    config.stash[BENCHMARK_RESULTS] = {}
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash[BENCHMARK_RESULTS]
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    width = max(len(name) for name in results)
+    for name, result in sorted(results.items()):
+        terminalreporter.write_line(
+            "{}  {:>10.4f} s  {:>10.1f} MiB".format(
+                name.ljust(width), result["time"], result["peak_memory"] / 2**20
+            )
+        )
+
 
 @pytest.fixture
 def smalldict():
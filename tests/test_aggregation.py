@@ -0,0 +1,60 @@
+import operator
+from functools import reduce
+
+import pytest
+
+import ticts
+from tests.conftest import CURRENT, HALFHOUR, ONEHOUR
+from ticts import TimeSeries, testing
+from ticts.utils import NO_DEFAULT
+
+
+@pytest.fixture
+def all_ts(smallts_withdefault, otherts_withdefault):
+    shifted = TimeSeries(
+        {key + HALFHOUR: 2 * value for key, value in smallts_withdefault.items()},
+        default=5,
+    )
+    return [smallts_withdefault, otherts_withdefault, shifted]
+
+
+class TestReduce:
+    @pytest.mark.parametrize("function", [operator.add, operator.mul, max])
+    def test_reduce_equals_chained_operations(self, all_ts, function):
+        expected = reduce(lambda a, b: a._operate(b, function), all_ts)
+        testing.assert_ts_equal(ticts.reduce(function, all_ts), expected)
+
+    def test_reduce_respects_lower_bound_of_no_default(self, all_ts, otherts):
+        result = ticts.reduce(operator.add, [*all_ts, otherts])
+        assert result.lower_bound == otherts.lower_bound
+        assert result.default is NO_DEFAULT
+
+    def test_reduce_on_empty_sequence_raises(self):
+        with pytest.raises(TypeError):
+            ticts.reduce(operator.add, [])
+
+    def test_reduce_on_non_timeseries_raises(self, smallts):
+        with pytest.raises(TypeError):
+            ticts.reduce(operator.add, [smallts, 1])
+
+
+class TestSumMean:
+    def test_sum_equals_chained_add(self, all_ts):
+        expected = all_ts[0] + all_ts[1] + all_ts[2]
+        testing.assert_ts_equal(ticts.sum(all_ts), expected)
+
+    def test_sum_of_many_columnar(self, smalldict):
+        all_ts = [
+            TimeSeries(smalldict, default=i, storage="columnar") for i in range(100)
+        ]
+        result = ticts.sum(all_ts)
+        assert result.storage == "columnar"
+        assert result.default == sum(range(100))
+        assert result[CURRENT + ONEHOUR] == 100
+
+    def test_mean(self, all_ts):
+        result = ticts.mean(all_ts)
+        expected = ticts.sum(all_ts)
+        for key in expected.index:
+            assert result[key] == expected[key] / 3
+        assert result.default == expected.default / 3
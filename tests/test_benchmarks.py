@@ -0,0 +1,249 @@
+"""Benchmarks of the hot paths of TimeSeries, deselected by default.
+
+Run them with ``pytest -m stress``, at other scales with
+``--benchmark-sizes=1e3,1e7``. The best time of several runs and the peak
+memory of one run are compared to ``benchmarks_baseline.json``, a benchmark
+failing when either exceeds the baseline by more than ``--benchmark-tolerance``.
+
+Timings depend on the machine: the baseline ones are scaled by the ratio of the
+time of a calibration workload, measured here and when the baseline was saved,
+and the spread of the runs is tolerated on top. Store a baseline of your own
+machine with ``--benchmark-save`` for closer comparisons.
+"""
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import BENCHMARK_RESULTS, CURRENT
+from ticts import TimeSeries
+
+pytestmark = pytest.mark.stress
+
+BASELINE_PATH = Path(__file__).parent / "benchmarks_baseline.json"
+
+# Absolute slacks, below which timings and allocations are noise
+TIME_SLACK = 1e-3
+MEMORY_SLACK = 2**16
+# Number of runs timed, unless they take more than MAX_DURATION seconds
+MIN_RUNS, MAX_RUNS, MAX_DURATION = 3, 7, 2
+CALIBRATION_RUNS = 20
+# Times the spread of the runs tolerated on top of the baseline
+SPREAD_FACTOR = 3
+
+STORAGES = ["sorteddict", "columnar"]
+GETITEM_COUNT = 1_000
+
+
+def _make_ts(size, storage, offset=0, step=2, **kwargs):
+    """TimeSeries of size random values, every step seconds from offset."""
+    keys = CURRENT.value + (np.arange(size) * step + offset) * 10**9
+    values = np.random.default_rng(offset).random(size)
+    return TimeSeries._from_arrays(keys, values, storage=storage, **kwargs)
+
+
+def _make_series(size):
+    index = pd.date_range(CURRENT, periods=size, freq="2s")
+    return pd.Series(np.random.default_rng(0).random(size), index=index, name="value")
+
+
+def _time(fn, max_runs=MAX_RUNS):
+    """Return the best time of several runs and their spread, the difference
+    between the median and the best time."""
+    timings = []
+    while len(timings) < max_runs and (
+        len(timings) < MIN_RUNS or sum(timings) < MAX_DURATION
+    ):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), float(np.median(timings)) - min(timings)
+
+
+def _measure(fn):
+    """Return the best time of several runs, their spread and the peak memory
+    of one run."""
+    duration, spread = _time(fn)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return duration, spread, peak_memory
+
+
+def _calibrate():
+    """Workload independent from ticts, mixing Python objects and NumPy as the
+    benchmarks do, timed to scale the timings of the baseline."""
+    rng = np.random.default_rng(0)
+
+    def workload():
+        values = rng.random(200_000)
+        sorted(values.tolist())
+        np.sort(values)
+        dict(enumerate(values[:50_000].tolist()))
+
+    duration, _ = _time(workload, max_runs=CALIBRATION_RUNS)
+    return duration
+
+
+@pytest.fixture(scope="session")
+def calibration():
+    return _calibrate()
+
+
+@pytest.fixture(scope="session")
+def baseline():
+    if not BASELINE_PATH.exists():
+        return {"calibration": None, "benchmarks": {}}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+@pytest.fixture(scope="session")
+def save_baseline(request, baseline, calibration):
+    results = request.config.stash[BENCHMARK_RESULTS]
+    yield
+    if request.config.getoption("--benchmark-save") and results:
+        benchmarks = baseline["benchmarks"]
+        if baseline["calibration"]:
+            # Results kept from the previous baseline are scaled on this machine
+            ratio = calibration / baseline["calibration"]
+            benchmarks = {
+                name: {**result, "time": result["time"] * ratio}
+                for name, result in benchmarks.items()
+            }
+        content = {"calibration": calibration, "benchmarks": {**benchmarks, **results}}
+        BASELINE_PATH.write_text(json.dumps(content, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture
+def run_benchmark(request, baseline, calibration, save_baseline):
+    """Measure fn, record it under the name of the test and compare it to the
+    baseline."""
+    config = request.config
+
+    def run(fn):
+        name = request.node.name.removeprefix("test_")
+        duration, spread, peak_memory = _measure(fn)
+        config.stash[BENCHMARK_RESULTS][name] = {
+            "time": duration,
+            "peak_memory": peak_memory,
+        }
+
+        if config.getoption("--benchmark-save") or name not in baseline["benchmarks"]:
+            return
+        tolerance = config.getoption("--benchmark-tolerance")
+        expected = baseline["benchmarks"][name]
+
+        def get_max_time(calibration, spread):
+            expected_time = expected["time"] * calibration / baseline["calibration"]
+            return expected_time * tolerance + max(TIME_SLACK, SPREAD_FACTOR * spread)
+
+        max_time = get_max_time(calibration, spread)
+        if duration > max_time:
+            # The load of the machine drifts: confirm on a new measurement
+            duration, spread = _time(fn)
+            max_time = get_max_time(_calibrate(), spread)
+        assert duration <= max_time, (
+            f"{name} took {duration:.4f}s, {max_time:.4f}s at most on this machine"
+            f" given the baseline {expected['time']:.4f}s."
+        )
+        assert (
+            peak_memory <= expected["peak_memory"] * tolerance + MEMORY_SLACK
+        ), f"{name} used {peak_memory} bytes, baseline is {expected['peak_memory']}."
+
+    return run
+
+
+class TestBenchmarkInit:
+    def test_init_from_dict(self, run_benchmark, benchmark_size):
+        dct = _make_series(benchmark_size).to_dict()
+        run_benchmark(lambda: TimeSeries(dct))
+
+    @pytest.mark.parametrize("storage", STORAGES)
+    def test_init_from_series(self, run_benchmark, benchmark_size, storage):
+        series = _make_series(benchmark_size)
+        run_benchmark(lambda: TimeSeries(series, storage=storage))
+
+    @pytest.mark.parametrize("storage", STORAGES)
+    def test_init_from_dataframe(self, run_benchmark, benchmark_size, storage):
+        df = _make_series(benchmark_size).to_frame()
+        run_benchmark(lambda: TimeSeries(df, storage=storage))
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+class TestBenchmarkAccess:
+    @pytest.mark.parametrize("interpolate", ["previous", "linear"])
+    def test_getitem(self, run_benchmark, benchmark_size, storage, interpolate):
+        ts = _make_ts(benchmark_size, storage)
+        # Keys in-between measurements, spread over the whole TimeSeries
+        offsets = np.linspace(0, 2 * benchmark_size - 1, GETITEM_COUNT).astype(int)
+        keys = [CURRENT + pd.Timedelta(seconds=int(offset) + 0.5) for offset in offsets]
+
+        def getitems():
+            for key in keys:
+                ts[key, interpolate]
+
+        run_benchmark(getitems)
+
+    def test_slice(self, run_benchmark, benchmark_size, storage):
+        ts = _make_ts(benchmark_size, storage)
+        start = CURRENT + pd.Timedelta(seconds=benchmark_size // 2 + 1)
+        end = CURRENT + pd.Timedelta(seconds=3 * benchmark_size // 2 + 1)
+        run_benchmark(lambda: ts.slice(start, end))
+
+    def test_compact(self, run_benchmark, benchmark_size, storage):
+        keys, values = _make_ts(benchmark_size, storage)._as_arrays()
+        ts = TimeSeries._from_arrays(keys, values.round(1), storage=storage)
+        run_benchmark(ts.compact)
+
+    def test_sample(self, run_benchmark, benchmark_size, storage):
+        ts = _make_ts(benchmark_size, storage)
+        run_benchmark(lambda: ts.sample("1s"))
+
+    def test_to_series(self, run_benchmark, benchmark_size, storage):
+        ts = _make_ts(benchmark_size, storage)
+        run_benchmark(ts.to_series)
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+class TestBenchmarkOperation:
+    def test_add(self, run_benchmark, benchmark_size, storage):
+        ts = _make_ts(benchmark_size, storage, default=0.0)
+        other = _make_ts(benchmark_size, storage, offset=1, default=0.0)
+        run_benchmark(lambda: ts + other)
+
+    def test_add_scalar(self, run_benchmark, benchmark_size, storage):
+        ts = _make_ts(benchmark_size, storage, default=0.0)
+        run_benchmark(lambda: ts + 1.0)
+
+    def test_mask_update(self, run_benchmark, benchmark_size, storage):
+        if benchmark_size > 100_000:
+            pytest.skip("mask_update is evaluated key by key.")
+        ts = _make_ts(benchmark_size, storage, default=0.0)
+        other = _make_ts(benchmark_size, storage, offset=1, default=0.0)
+        mask = TimeSeries({CURRENT: True, CURRENT + pd.Timedelta("1h"): False})
+        run_benchmark(lambda: ts.mask_update(other, mask))
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+class TestBenchmarkIO:
+    def test_serialize(self, run_benchmark, benchmark_size, storage):
+        ts = _make_ts(benchmark_size, storage)
+        run_benchmark(ts.serialize)
+
+    def test_to_json(self, run_benchmark, benchmark_size, storage, tmp_path):
+        ts = _make_ts(benchmark_size, storage)
+        run_benchmark(lambda: ts.to_json(tmp_path / "ts.json"))
+
+    def test_from_json(self, run_benchmark, benchmark_size, storage, tmp_path):
+        path = tmp_path / "ts.json"
+        _make_ts(benchmark_size, storage).to_json(path)
+        run_benchmark(lambda: TimeSeries.from_json(path, storage=storage))
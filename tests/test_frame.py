@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import CURRENT, HALFHOUR, ONEHOUR, ONEMIN
+from ticts import TimeSeries, TimeSeriesFrame, testing
+
+
+@pytest.fixture
+def frame(smallts_withdefault, otherts):
+    return TimeSeriesFrame({"small": smallts_withdefault, "other": otherts})
+
+
+class TestTimeSeriesFrame:
+    def test_init_aligns_on_union(self, frame, smallts_withdefault, otherts):
+        assert frame.columns == ["small", "other"]
+        assert len(frame) == 11
+        assert frame.index[0] == CURRENT
+        assert frame.index[3] == CURRENT + 2 * ONEHOUR + HALFHOUR
+
+    def test_init_from_list(self, smallts, otherts):
+        otherts.name = "other"
+        frame = TimeSeriesFrame([smallts, otherts])
+        assert frame.columns == ["value", "other"]
+
+        with pytest.raises(ValueError):
+            TimeSeriesFrame([smallts, smallts])
+
+    def test_getitem_keeps_meta(self, frame, smallts_withdefault, otherts):
+        small = frame["small"]
+        assert small.default == smallts_withdefault.default
+        assert small.name == "small"
+        testing.assert_ts_equal(small.compact(), smallts_withdefault, check_name=False)
+
+        other = frame["other"]
+        assert not other._has_default
+        assert other.lower_bound == otherts.lower_bound
+        assert other[CURRENT + 3 * ONEHOUR] == 2000
+
+        with pytest.raises(KeyError):
+            frame["missing"]
+
+    def test_setitem_realigns(self, frame):
+        frame["new"] = TimeSeries({CURRENT + ONEHOUR + HALFHOUR: 5})
+        assert len(frame) == 12
+        assert frame["new"].lower_bound == CURRENT + ONEHOUR + HALFHOUR
+        assert frame["other"][CURRENT + ONEHOUR + HALFHOUR] is None
+        assert frame["small"][CURRENT + ONEHOUR + HALFHOUR] == 1
+
+    def test_operate_on_scalar(self, frame, smallts_withdefault, otherts):
+        result = frame * 2
+        testing.assert_ts_equal(
+            result["small"].compact(), smallts_withdefault * 2, check_name=False
+        )
+        assert result["small"].default == 20
+        testing.assert_ts_equal(
+            result["other"].compact(), otherts * 2, check_name=False
+        )
+
+    def test_operate_on_frame(self, smallts_withdefault, otherts_withdefault):
+        frame = TimeSeriesFrame({"a": smallts_withdefault, "b": otherts_withdefault})
+        other = TimeSeriesFrame({"a": otherts_withdefault, "b": smallts_withdefault})
+        result = frame - other
+
+        expected = smallts_withdefault - otherts_withdefault
+        assert result["a"].default == -890
+        assert result["b"].default == 890
+        np.testing.assert_array_equal(result["a"].at(expected.index), expected.values())
+
+    def test_operate_on_timeseries(self, frame, smallts_withdefault, otherts):
+        result = frame + otherts
+        expected = smallts_withdefault + otherts
+        assert result["small"].lower_bound == otherts.lower_bound
+        np.testing.assert_array_equal(
+            result["small"].at(expected.index), expected.values()
+        )
+
+    def test_operate_on_different_columns(self, frame, smallts):
+        with pytest.raises(ValueError):
+            frame + TimeSeriesFrame({"small": smallts})
+
+    def test_sample(self, frame, smallts_withdefault, otherts):
+        sampled = frame.sample("30min")
+        testing.assert_ts_equal(
+            sampled["small"], smallts_withdefault.sample("30min"), check_name=False
+        )
+        testing.assert_ts_equal(
+            sampled["other"].compact(),
+            otherts.sample("30min").compact(),
+            check_name=False,
+        )
+        assert sampled["other"].lower_bound == otherts.lower_bound
+
+    def test_sample_from_start_before_first_key(self, smallts, otherts):
+        start = CURRENT - 45 * ONEMIN
+        frame = TimeSeriesFrame({"small": smallts, "other": otherts})
+        sampled = frame.sample("30min", start=start)
+        assert sampled.index[0] == CURRENT
+        testing.assert_ts_equal(
+            sampled["small"], smallts.sample("30min", start=start), check_name=False
+        )
+
+    def test_slice(self, frame, smallts_withdefault, otherts):
+        start, end = CURRENT + HALFHOUR, CURRENT + 3 * ONEHOUR + HALFHOUR
+        sliced = frame.slice(start, end)
+        testing.assert_ts_equal(
+            sliced["small"].compact(),
+            smallts_withdefault.slice(start, end),
+            check_name=False,
+        )
+        testing.assert_ts_equal(
+            sliced["other"].compact(), otherts.slice(start, end), check_name=False
+        )
+
+    def test_to_dataframe(self, frame, otherts):
+        df = frame.to_dataframe()
+        assert list(df.columns) == ["small", "other"]
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert np.isnan(df["other"].iloc[0])
+        assert df["other"].loc[CURRENT + 5 * ONEHOUR] == 3000
@@ -0,0 +1,76 @@
+import pytest
+
+import ticts
+from tests.conftest import CURRENT, HALFHOUR
+from ticts import TimeSeries, instrumentation, testing
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self, smallts):
+        original = TimeSeries.__dict__["slice"]
+        smallts + smallts
+        assert ticts.stats().empty
+        assert not instrumentation.is_enabled()
+        assert TimeSeries.__dict__["slice"] is original
+
+    def test_instrument_records(self, smallts, otherts):
+        with ticts.instrument():
+            smallts + otherts
+            smallts[CURRENT + HALFHOUR]
+            smallts.slice(CURRENT, CURRENT + 2 * HALFHOUR)
+
+        stats = ticts.stats()
+        assert stats.loc["TimeSeries._operate_on_ts", "calls"] == 1
+        assert stats.loc["TimeSeries._operate_on_ts", "points"] == len(smallts)
+        assert stats.loc["TimeSeries.__getitem__", "points"] == 1
+        assert stats.loc["TimeSeries.slice", "calls"] == 1
+        assert stats.loc["timestamp_converter", "calls"] >= 3
+        assert (stats["time"] > 0).all()
+
+    def test_instrument_restores(self, smallts):
+        original = TimeSeries.__dict__["__getitem__"]
+        inherited = TimeSeries.integral
+        with ticts.instrument():
+            assert TimeSeries.__dict__["__getitem__"] is not original
+        assert TimeSeries.__dict__["__getitem__"] is original
+        assert "integral" not in TimeSeries.__dict__
+        assert TimeSeries.integral is inherited
+        assert ticts.timeseries.timestamp_converter is ticts.utils.timestamp_converter
+
+    def test_instrument_classmethod(self, smallts):
+        keys, values = smallts._as_arrays()
+        with ticts.instrument():
+            ts = TimeSeries._from_arrays(keys, values)
+        testing.assert_ts_equal(ts, smallts)
+        assert ticts.stats().loc["TimeSeries._from_arrays", "points"] == len(smallts)
+
+    def test_hook(self, smallts):
+        calls = []
+        with ticts.instrument(hook=lambda *args: calls.append(args)):
+            smallts.compact()
+        names = [name for name, _, _ in calls]
+        assert "TimeSeries.compact" in names
+
+        calls.clear()
+        smallts.compact()
+        assert not calls
+
+    def test_exception_recorded(self, smallts):
+        with ticts.instrument(), pytest.raises(ValueError):
+            smallts.sample()
+        assert ticts.stats().loc["TimeSeries.sample", "calls"] == 1
+
+    def test_exception_raised_unchanged(self):
+        with ticts.instrument(), pytest.raises(ValueError):
+            TimeSeries(tz="Not/AZone")
+        stats = ticts.stats().loc["TimeSeries.__init__"]
+        assert stats["calls"] == 1
+        assert stats["points"] == 0
@@ -1,6 +1,12 @@
+import gzip
+import io
 import json
 
+import pytest
+
+from tests.conftest import CURRENT, HALFHOUR, ONEHOUR
 from ticts import TimeSeries, testing
+from ticts.io import _JSONStreamReader
 
 
 class TestJSON:
@@ -33,3 +39,155 @@ class TestJSON:
         smallts.to_json(path)
         ts_read = TimeSeries.from_json(path)
         testing.assert_ts_equal(smallts, ts_read)
+
+    def test_to_json_streams_the_same_document(self, smallts, monkeypatch):
+        monkeypatch.setattr("ticts.io.JSON_CHUNKSIZE", 3)
+        ts = TimeSeries(smallts, default=10)
+        assert ts.to_json(None) == json.dumps(ts.serialize())
+        assert TimeSeries().to_json(None) == json.dumps(TimeSeries().serialize())
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_json_roundtrip_with_compression(self, smallts, tmpdir, storage):
+        path = tmpdir.join("test.json.gz")
+        ts = TimeSeries(smallts, default=10, name="SomeName")
+        ts.to_json(path)
+
+        ts_read = TimeSeries.from_json(path, storage=storage)
+        assert ts_read.storage == storage
+        testing.assert_ts_equal(ts, ts_read)
+
+    def test_from_json_parses_incrementally(self, smallts, monkeypatch):
+        monkeypatch.setattr("ticts.io.JSON_CHUNKSIZE", 3)
+        buffer = io.StringIO(json.dumps(smallts.serialize(date_format="iso"), indent=2))
+        reader = _JSONStreamReader(buffer, chunksize=7)
+        monkeypatch.setattr("ticts.io._JSONStreamReader", lambda fh: reader)
+
+        ts_read = TimeSeries.from_json(buffer)
+        testing.assert_ts_equal(smallts, ts_read)
+
+    def test_from_json_on_binary_handles(self, smallts, tmpdir, monkeypatch):
+        ts = TimeSeries(smallts, name="énergie")
+        path = tmpdir.join("test.json.gz")
+        ts.to_json(path)
+        with gzip.open(path) as fh:
+            testing.assert_ts_equal(ts, TimeSeries.from_json(fh))
+
+        # Non-ASCII characters are split between chunks of one byte
+        content = json.dumps(ts.serialize(), ensure_ascii=False).encode()
+        buffer = io.BytesIO(content)
+        reader = _JSONStreamReader(buffer, chunksize=1)
+        monkeypatch.setattr("ticts.io._JSONStreamReader", lambda fh: reader)
+        testing.assert_ts_equal(ts, TimeSeries.from_json(buffer))
+
+    def test_from_json_keeps_value_types(self):
+        content = {"data": {"0": 1, "1": 1.5, "2": None}, "default": "no_default"}
+        ts_read = TimeSeries.from_json(io.StringIO(json.dumps(content)))
+        assert list(ts_read.values()) == [1, 1.5, None]
+        assert isinstance(ts_read.values()[0], int)
+
+
+class TestBinary:
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_it_returns_timeseries_from_binary(self, smallts, tmpdir, storage):
+        ts = TimeSeries(smallts, default=10, name="SomeName", storage=storage)
+        ts = ts.tz_convert("CET")
+        path = tmpdir.join("test.bin")
+        ts.to_binary(path)
+
+        ts_read = TimeSeries.from_binary(path)
+        assert ts_read.storage == "columnar"
+        assert ts_read.tz == "CET"
+        testing.assert_ts_equal(ts, ts_read)
+
+    def test_empty_timeseries(self, emptyts, tmpdir):
+        path = tmpdir.join("test.bin")
+        emptyts.to_binary(path)
+        testing.assert_ts_equal(emptyts, TimeSeries.from_binary(path, mmap=True))
+
+    def test_mmap_is_read_only_and_copied_on_mutation(self, smallts, tmpdir):
+        path = tmpdir.join("test.bin")
+        smallts.to_binary(path)
+
+        ts_read = TimeSeries.from_binary(path, mmap=True)
+        testing.assert_ts_equal(smallts, ts_read)
+        with pytest.raises(ValueError):
+            ts_read.data.array_values[0] = 1000
+
+        ts_read[CURRENT] = 1000
+        assert ts_read[CURRENT] == 1000
+        testing.assert_ts_equal(smallts, TimeSeries.from_binary(path, mmap=True))
+
+    def test_to_binary_with_objects_raises(self, tmpdir):
+        ts = TimeSeries({CURRENT: "foo"})
+        with pytest.raises(TypeError):
+            ts.to_binary(tmpdir.join("test.bin"))
+
+    def test_from_binary_on_other_file_raises(self, smallts, tmpdir):
+        path = tmpdir.join("test.json")
+        smallts.to_json(path)
+        with pytest.raises(ValueError):
+            TimeSeries.from_binary(path)
+
+
+class TestParquet:
+    @pytest.fixture(autouse=True)
+    def _requires_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_it_returns_timeseries_from_parquet(self, smallts, tmpdir, storage):
+        ts = TimeSeries(smallts, default=10, name="SomeName").tz_convert("CET")
+        path = tmpdir.join("test.parquet")
+        ts.to_parquet(path)
+
+        ts_read = TimeSeries.from_parquet(path, storage=storage)
+        assert ts_read.storage == storage
+        assert ts_read.tz == "CET"
+        testing.assert_ts_equal(ts, ts_read)
+
+    def test_objects_and_empty_timeseries(self, emptyts, tmpdir):
+        path = tmpdir.join("test.parquet")
+        ts = TimeSeries({CURRENT: "foo", CURRENT + ONEHOUR: "bar"})
+        ts.to_parquet(path)
+        testing.assert_ts_equal(ts, TimeSeries.from_parquet(path))
+
+        emptyts.to_parquet(path)
+        testing.assert_ts_equal(emptyts, TimeSeries.from_parquet(path))
+
+    @pytest.mark.parametrize(
+        "start, end",
+        [
+            (CURRENT + 3 * ONEHOUR, CURRENT + 5 * ONEHOUR),
+            (CURRENT + 3 * ONEHOUR + HALFHOUR, CURRENT + 7 * ONEHOUR + HALFHOUR),
+            (CURRENT - ONEHOUR, CURRENT + 2 * ONEHOUR),
+            (CURRENT + 20 * ONEHOUR, CURRENT + 21 * ONEHOUR),
+            (CURRENT + 3 * ONEHOUR, CURRENT + 3 * ONEHOUR),
+            (CURRENT + 3 * ONEHOUR + HALFHOUR, CURRENT + ONEHOUR),
+        ],
+    )
+    def test_from_parquet_on_range_equals_slice(self, smallts, tmpdir, start, end):
+        path = tmpdir.join("test.parquet")
+        smallts.to_parquet(path, row_group_size=2)
+
+        ts_read = TimeSeries.from_parquet(path, start=start, end=end)
+        testing.assert_ts_equal(ts_read, smallts.slice(start, end))
+
+    def test_from_parquet_on_range_of_empty_timeseries(self, tmpdir):
+        path = tmpdir.join("test.parquet")
+        ts = TimeSeries(default=10)
+        ts.to_parquet(path)
+
+        ts_read = TimeSeries.from_parquet(path, start=CURRENT, end=CURRENT + ONEHOUR)
+        testing.assert_ts_equal(ts_read, ts.slice(CURRENT, CURRENT + ONEHOUR))
+
+    def test_from_parquet_skips_row_groups_out_of_range(self, smallts, tmpdir, mocker):
+        path = tmpdir.join("test.parquet")
+        smallts.to_parquet(path, row_group_size=2)
+
+        import pyarrow.parquet as pq
+
+        read_row_groups = mocker.spy(pq.ParquetFile, "read_row_groups")
+        TimeSeries.from_parquet(
+            path, CURRENT + 4 * ONEHOUR + HALFHOUR, CURRENT + 6 * ONEHOUR
+        )
+        assert read_row_groups.call_args.args[1] == [2]
@@ -0,0 +1,54 @@
+import pytest
+
+import ticts.lazy
+from tests.conftest import CURRENT, ONEHOUR
+from ticts import LazyTimeSeries, TimeSeries, testing
+
+
+@pytest.fixture(params=["sorteddict", "columnar"])
+def storage(request):
+    return request.param
+
+
+class TestLazyTimeSeries:
+    def test_lazy_returns_expression(self, smallts):
+        expression = smallts.lazy() + smallts
+        assert isinstance(expression, LazyTimeSeries)
+        assert isinstance(smallts + smallts.lazy(), LazyTimeSeries)
+
+    @pytest.mark.parametrize("with_default", [True, False])
+    def test_compute_equals_eager(self, smalldict, otherict, storage, with_default):
+        kwargs = {"default": 10} if with_default else {}
+        ts1 = TimeSeries(smalldict, storage=storage, **kwargs)
+        ts2 = TimeSeries(otherict, storage=storage, **kwargs)
+        ts3 = TimeSeries({CURRENT + ONEHOUR: 2}, storage=storage, **kwargs)
+
+        expected = (ts1 + ts2) * ts3 - ts2.floor(1500)
+        result = ((ts1.lazy() + ts2) * ts3 - ts2.lazy().floor(1500)).compute()
+        testing.assert_ts_equal(result, expected)
+
+    def test_compute_with_scalars(self, smallts_withdefault):
+        ts = smallts_withdefault
+        expected = (ts * 2 + 1) / 4
+        result = ((ts.lazy() * 2 + 1) / 4).compute()
+        testing.assert_ts_equal(result, expected)
+
+    def test_compute_comparison(self, smallts, otherts):
+        expected = (smallts + otherts) > 1500
+        result = ((smallts.lazy() + otherts) > 1500).compute()
+        testing.assert_ts_equal(result, expected)
+
+    def test_reads_compute(self, smallts, otherts):
+        expression = smallts.lazy() + otherts
+        expected = smallts + otherts
+        assert expression[CURRENT + 3 * ONEHOUR] == expected[CURRENT + 3 * ONEHOUR]
+        assert len(expression) == len(expected)
+        assert list(expression.index) == list(expected.index)
+
+    def test_merges_indexes_once(self, mocker, smallts, otherts):
+        spy = mocker.spy(ticts.lazy, "_align_for_operation")
+        expression = (smallts.lazy() + otherts) * smallts - otherts.lazy().ceil(0)
+        expression.compute()
+        assert spy.call_count == 1
+        # each TimeSeries is aligned only once
+        assert len(spy.call_args.args[0]) == 2
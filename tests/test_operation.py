@@ -1,3 +1,5 @@
+import operator
+
 import pytest
 from inline_snapshot import snapshot
 
@@ -208,6 +210,49 @@ class TestTictsFloorCeil:
         assert ts[CURRENT + 4 * ONEHOUR] == 3000
 
 
+class TestTictsMergeJoin:
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    @pytest.mark.parametrize("op", [operator.add, operator.truediv, operator.lt, max])
+    def test_operate_on_ts_equals_key_by_key(
+        self, smallts_withdefault, otherts, storage, op
+    ):
+        left = TimeSeries(smallts_withdefault, storage=storage)
+        right = TimeSeries(otherts, storage=storage)
+        result = left._operate(right, op)
+
+        keys = sorted(set(left.index) | set(right.index))
+        keys = [key for key in keys if key >= right.lower_bound]
+        assert list(result.index) == keys
+        assert list(result.values()) == [op(left[key], right[key]) for key in keys]
+
+    def test_operate_keeps_columnar_storage(self, smallts):
+        ts = TimeSeries(smallts, storage="columnar")
+        assert (ts + smallts).storage == "columnar"
+        assert (smallts + smallts).storage == "sorteddict"
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    @pytest.mark.parametrize("op", [operator.add, operator.truediv, operator.lt, max])
+    def test_operate_on_scalar_equals_key_by_key(
+        self, smallts_withdefault, storage, op
+    ):
+        ts = TimeSeries(smallts_withdefault, storage=storage).tz_convert("CET")
+        result = ts._operate(4, op)
+        assert result.storage == storage
+        assert result.tz == "CET"
+        assert result.default == op(ts.default, 4)
+        assert list(result.index) == list(ts.index)
+        assert list(result.values()) == [op(value, 4) for value in ts.values()]
+
+    def test_operate_on_non_numeric_values(self):
+        ts = TimeSeries({CURRENT: "a", CURRENT + ONEHOUR: "b"})
+        result = ts + TimeSeries({CURRENT + HALFHOUR: "c"}, default="z")
+        assert list(result.values()) == ["az", "ac", "bc"]
+
+    def test_div_by_zero_raises(self, smallts):
+        with pytest.raises(ZeroDivisionError):
+            smallts / smallts
+
+
 class TestMaskUpdate:
     """
                 0    1    2    3    4    5    6    7    8    9
@@ -4,6 +4,7 @@ from pandas.tseries.frequencies import to_offset
 
 from tests.conftest import CURRENT, HALFHOUR, ONEHOUR, ONEMIN
 from ticts import TimeSeries, testing
+from ticts.utils import timestamp_converter
 
 
 class TestToSeries:
@@ -145,3 +146,20 @@ class TestTimeSeriesSample:
             smallts[smallts.lower_bound + freq],
         ]
         list(ts.values()) == expected_values
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_sample_linear(self, smallts, storage):
+        ts = TimeSeries(smallts, storage=storage).sample(HALFHOUR, interpolate="linear")
+        assert ts.storage == storage
+        assert list(ts.values()) == [i / 2 for i in range(19)]
+
+    def test_sample_by_passing_an_unsorted_index_with_interpolate(self, smallts):
+        index = [CURRENT + HALFHOUR, CURRENT - ONEHOUR, CURRENT + HALFHOUR]
+        ts = smallts.sample(index=index, interpolate="linear")
+        assert list(ts.index) == [CURRENT - ONEHOUR, CURRENT + HALFHOUR]
+        assert list(ts.values()) == [None, 0.5]
+
+    def test_sample_on_non_fixed_frequency_keeps_start(self, smallts):
+        start = CURRENT + 5 * ONEHOUR
+        ts = smallts.sample("MS", start=start, end=CURRENT + 40 * 24 * ONEHOUR)
+        assert list(ts.index) == [start, timestamp_converter("2019-02-01T05:00:00")]
@@ -0,0 +1,44 @@
+import pytest
+
+import ticts
+from tests.conftest import ONEHOUR
+from ticts import testing
+
+
+def _shift_and_sum(ts):
+    return (ts + 1).integral(unit="h")
+
+
+def _double(ts):
+    return ts * 2
+
+
+def _fail(ts):
+    raise ValueError("failing on purpose")
+
+
+@pytest.fixture
+def all_ts(smallts_withdefault):
+    return [smallts_withdefault * i for i in range(10)]
+
+
+class TestParallelMap:
+    @pytest.mark.parametrize("chunksize", [1, 3])
+    def test_map_keeps_order(self, all_ts, chunksize):
+        results = ticts.parallel.map(
+            _shift_and_sum, all_ts, workers=2, chunksize=chunksize
+        )
+        assert list(results) == [_shift_and_sum(ts) for ts in all_ts]
+
+    def test_map_returns_timeseries(self, all_ts):
+        results = list(ticts.parallel.map(_double, iter(all_ts), workers=2, prefetch=1))
+        for result, ts in zip(results, all_ts):
+            testing.assert_ts_equal(result, ts * 2)
+
+    def test_map_in_current_process(self, all_ts):
+        results = ticts.parallel.map(lambda ts: ts.lower_bound + ONEHOUR, all_ts, 1)
+        assert list(results) == [ts.lower_bound + ONEHOUR for ts in all_ts]
+
+    def test_map_raises(self, all_ts):
+        with pytest.raises(ValueError, match="failing on purpose"):
+            list(ticts.parallel.map(_fail, all_ts, workers=2))
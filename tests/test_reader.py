@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from tests.conftest import CURRENT, HALFHOUR, ONEHOUR, ONEMIN
+from ticts import TimeSeries
+
+
+@pytest.fixture(params=["sorteddict", "columnar"])
+def ts(request, smalldict):
+    return TimeSeries(smalldict, default=-1, storage=request.param)
+
+
+def _all_keys():
+    return [CURRENT - ONEHOUR + i * 7 * ONEMIN for i in range(120)]
+
+
+class TestTimeSeriesReader:
+    @pytest.mark.parametrize("interpolate", ["previous", "linear"])
+    def test_forward_reads(self, ts, interpolate):
+        reader = ts.reader(interpolate=interpolate)
+        keys = _all_keys()
+        assert [reader[key] for key in keys] == [ts[key, interpolate] for key in keys]
+
+    def test_backward_jumps(self, ts):
+        reader = ts.reader()
+        keys = _all_keys()
+        keys = keys[60:] + keys[:60] + keys[::-1]
+        assert [reader[key] for key in keys] == [ts[key] for key in keys]
+
+    def test_exact_keys_and_interpolate_per_read(self, ts):
+        reader = ts.reader()
+        assert reader[CURRENT + ONEHOUR] == 1
+        assert reader[CURRENT + ONEHOUR + HALFHOUR, "linear"] == 1.5
+        assert reader.get(CURRENT + ONEHOUR + HALFHOUR) == 1
+        assert reader["2019-01-01 02:00:00"] == 2
+
+    def test_out_of_left_bound(self, smallts):
+        assert smallts.reader()[CURRENT - ONEHOUR] is None
+
+        smallts.permissive = False
+        with pytest.raises(KeyError):
+            smallts.reader()[CURRENT - ONEHOUR]
+
+    def test_empty(self, emptyts, emptyts_withdefault):
+        assert emptyts.reader()[CURRENT] is None
+        assert emptyts_withdefault.reader()[CURRENT] == 10
+
+    def test_snapshot(self, ts):
+        reader = ts.reader()
+        ts[CURRENT + pd.Timedelta("1d")] = 100
+        assert reader[CURRENT + pd.Timedelta("1d")] == 9
+
+    def test_unknown_interpolate(self, ts):
+        with pytest.raises(ValueError):
+            ts.reader()[CURRENT, "nearest"]
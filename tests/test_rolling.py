@@ -0,0 +1,62 @@
+import pytest
+
+from tests.conftest import CURRENT, HALFHOUR, ONEHOUR
+from ticts import TimeSeries
+
+
+@pytest.fixture
+def stepts():
+    return TimeSeries(
+        {
+            CURRENT: 1,
+            CURRENT + ONEHOUR: 3,
+            CURRENT + 3 * ONEHOUR: 0,
+            CURRENT + 3 * ONEHOUR + HALFHOUR: 2,
+        },
+        default=2,
+    )
+
+
+class TestRolling:
+    def test_rolling_mean(self, stepts):
+        ts = stepts.rolling("2h").mean()
+        assert list(ts.index) == list(stepts.index)
+        assert list(ts.values()) == [2, 1.5, 3, 1.5 + 0.75]
+        assert ts.default == stepts.default
+
+    def test_rolling_integral(self, stepts):
+        ts = stepts.rolling("2h").integral(unit="h")
+        assert list(ts.values()) == [4, 3, 6, 4.5]
+
+    def test_rolling_min_max(self, stepts):
+        assert list(stepts.rolling("2h").min().values()) == [1, 1, 0, 0]
+        assert list(stepts.rolling("2h").max().values()) == [2, 3, 3, 3]
+        assert list(stepts.rolling(HALFHOUR).max().values()) == [2, 3, 3, 2]
+
+    def test_rolling_linear(self, stepts):
+        rolling = stepts.rolling("2h", interpolate="linear")
+        assert list(rolling.min().values()) == [1, 1, 0, 0]
+        # the window of the last key starts at 1.5 (halfway from 3 to 0)
+        assert list(rolling.max().values()) == [2, 3, 3, 2.25]
+
+    def test_rolling_without_default_starts_on_lower_bound(self, smallts):
+        ts = smallts.rolling(3 * ONEHOUR + HALFHOUR).mean()
+        assert list(ts.values())[:4] == [0, 0, 0.5, 1]
+        assert smallts.rolling("2h").min()[CURRENT + 5 * ONEHOUR] == 3
+
+    @pytest.mark.parametrize("interpolate", ["previous", "linear"])
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_rolling_mean_equals_mean_on_windows(self, stepts, storage, interpolate):
+        ts = TimeSeries(stepts, storage=storage)
+        rolled = ts.rolling("90min", interpolate=interpolate).mean()
+        for key in ts.index:
+            expected = ts.mean(key - HALFHOUR - ONEHOUR, key, interpolate)
+            assert rolled[key] == pytest.approx(expected)
+
+    def test_rolling_on_non_positive_window_raises(self, stepts):
+        with pytest.raises(ValueError):
+            stepts.rolling(0)
+
+    def test_rolling_on_objects_raises(self):
+        with pytest.raises(TypeError):
+            TimeSeries({CURRENT: "foo"}).rolling(ONEHOUR)
@@ -0,0 +1,149 @@
+import pandas as pd
+import pytest
+
+from tests.conftest import CURRENT, HALFHOUR, ONEHOUR
+from ticts import TimeSeries
+
+
+@pytest.fixture
+def stepts():
+    return TimeSeries(
+        {CURRENT: 1, CURRENT + ONEHOUR: 3, CURRENT + 3 * ONEHOUR: 0}, default=2
+    )
+
+
+def iterintervals_integral(ts, start, end):
+    """Reference integral of a step function, from iterintervals."""
+    ts = ts.slice(start, end)
+    return sum(
+        ts[left] * (right - left).total_seconds()
+        for left, right in ts.iterintervals(end)
+    )
+
+
+class TestIntegral:
+    def test_integral_previous(self, stepts):
+        assert stepts.integral(unit="h") == 7
+        assert stepts.integral(end=CURRENT + 4 * ONEHOUR, unit="h") == 7
+        assert stepts.integral(CURRENT - ONEHOUR, CURRENT + HALFHOUR, unit="h") == 2.5
+
+    def test_integral_linear(self, stepts):
+        assert stepts.integral(interpolate="linear", unit="h") == 5
+        integral = stepts.integral(
+            CURRENT + HALFHOUR, CURRENT + 2 * ONEHOUR, interpolate="linear", unit="h"
+        )
+        assert integral == pytest.approx((2 + 3) / 2 * 0.5 + (3 + 1.5) / 2)
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_integral_equals_iterintervals(self, smallts, storage):
+        ts = TimeSeries(smallts, storage=storage)
+        start, end = CURRENT + HALFHOUR, CURRENT + 7 * ONEHOUR + HALFHOUR
+        assert ts.integral(start, end) == iterintervals_integral(smallts, start, end)
+
+    def test_integral_linear_holds_default_until_lower_bound(self, stepts):
+        integral = stepts.integral(
+            CURRENT - ONEHOUR, CURRENT + ONEHOUR, interpolate="linear", unit="h"
+        )
+        assert integral == 2 + 2
+
+    def test_integral_on_empty_interval(self, stepts):
+        assert stepts.integral(CURRENT + ONEHOUR, CURRENT + ONEHOUR) == 0
+
+    def test_integral_with_start_higher_than_end_raises(self, stepts):
+        with pytest.raises(ValueError):
+            stepts.integral(CURRENT + ONEHOUR, CURRENT)
+
+    def test_integral_without_default_before_lower_bound_raises(self, smallts):
+        with pytest.raises(TypeError):
+            smallts.integral(CURRENT - ONEHOUR, CURRENT + ONEHOUR)
+
+
+class TestStatistics:
+    def test_mean(self, stepts):
+        assert stepts.mean() == pytest.approx(7 / 3)
+        assert stepts.mean(interpolate="linear") == pytest.approx(5 / 3)
+        assert stepts.mean(CURRENT + HALFHOUR, CURRENT + HALFHOUR) == 1
+
+    def test_min_max(self, stepts):
+        assert stepts.min() == 1
+        assert stepts.max() == 3
+        assert stepts.min(end=CURRENT + 4 * ONEHOUR) == 0
+        assert stepts.min(CURRENT - ONEHOUR, CURRENT + 2 * ONEHOUR) == 1
+        assert stepts.max(CURRENT - ONEHOUR, CURRENT + HALFHOUR) == 2
+
+    def test_min_max_of_two_points(self):
+        ts = TimeSeries({CURRENT: 1, CURRENT + ONEHOUR: 100})
+        assert ts.min() == ts.max() == 1
+        assert ts.describe()["max"] == 1
+        assert ts.max(interpolate="linear") == 100
+
+    def test_min_max_linear(self, stepts):
+        start, end = CURRENT + HALFHOUR, CURRENT + 2 * ONEHOUR
+        assert stepts.min(start, end, interpolate="linear") == 1.5
+        assert stepts.max(start, end, interpolate="linear") == 3
+
+    def test_describe(self, stepts):
+        described = stepts.describe(end=CURRENT + 4 * ONEHOUR)
+        assert described["count"] == 3
+        assert described["duration"] == pd.Timedelta(hours=4)
+        assert described["mean"] == pytest.approx(7 / 4)
+        # weighted squares: (1 + 9 * 2 + 0) / 4
+        assert described["std"] == pytest.approx((19 / 4 - (7 / 4) ** 2) ** 0.5)
+        assert described["min"] == 0
+        assert described["max"] == 3
+
+
+class TestResample:
+    @pytest.mark.parametrize(
+        "agg, expected",
+        [
+            ("mean", [1, 3, 3, 0]),
+            ("integral", [3600, 3 * 3600, 3 * 3600, 0]),
+            ("min", [1, 3, 3, 0]),
+            ("last", [1, 3, 3, 0]),
+            ("count", [1, 1, 0, 1]),
+        ],
+    )
+    def test_resample_on_keys(self, stepts, agg, expected):
+        ts = stepts.resample("1h", agg=agg)
+        assert list(ts.index) == [CURRENT + i * ONEHOUR for i in range(4)]
+        assert list(ts.values()) == expected
+
+    def test_resample_mean_is_time_weighted(self, stepts):
+        ts = stepts.resample("2h", start=CURRENT - ONEHOUR)
+        assert list(ts.index) == [CURRENT + (2 * i - 1) * ONEHOUR for i in range(3)]
+        assert list(ts.values()) == [1.5, 3, 0]
+        assert ts.default == stepts.default
+
+    def test_resample_linear(self, stepts):
+        ts = stepts.resample(
+            "2h", agg="max", interpolate="linear", end=CURRENT + 3 * ONEHOUR
+        )
+        assert list(ts.values()) == [3, 1.5]
+        ts = stepts.resample(
+            "2h", agg="mean", interpolate="linear", end=CURRENT + 3 * ONEHOUR
+        )
+        assert list(ts.values()) == [2.125, 0.75]
+
+    def test_resample_linear_holds_default_until_lower_bound(self, stepts):
+        ts = stepts.resample(
+            "2h", interpolate="linear", start=CURRENT - ONEHOUR, end=CURRENT + ONEHOUR
+        )
+        assert list(ts.values()) == [2]
+
+    def test_resample_without_default_starts_on_lower_bound(self, smallts):
+        ts = smallts.resample("2h", start=CURRENT - 4 * ONEHOUR + HALFHOUR)
+        # the first bucket is [CURRENT, CURRENT + HALFHOUR) only
+        assert ts.lower_bound == CURRENT - ONEHOUR - HALFHOUR
+        assert list(ts.values())[:2] == [0, 1]
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_resample_equals_mean_on_buckets(self, smallts, storage):
+        ts = TimeSeries(smallts, storage=storage)
+        resampled = ts.resample("3h", start=CURRENT + HALFHOUR)
+        for key in resampled.index:
+            assert resampled[key] == ts.mean(key, key + 3 * ONEHOUR)
+
+    def test_resample_with_unknown_aggregation_raises(self, stepts):
+        with pytest.raises(ValueError):
+            stepts.resample("1h", agg="median")
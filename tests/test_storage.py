@@ -0,0 +1,232 @@
+from copy import deepcopy
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.conftest import CURRENT, HALFHOUR, ONEHOUR
+from ticts import TimeSeries, testing
+from ticts.storage import ColumnarStore
+
+
+@pytest.fixture
+def columnarts(smalldict):
+    return TimeSeries(smalldict, storage="columnar")
+
+
+class TestColumnarStore:
+    def test_init_sorts_and_keeps_last_duplicate(self):
+        store = ColumnarStore([3, 1, 2, 1], [30, 10, 20, 11])
+        assert store.int_keys.tolist() == [1, 2, 3]
+        assert store.array_values.tolist() == [11, 20, 30]
+
+    def test_init_raises_on_length_mismatch(self):
+        with pytest.raises(ValueError):
+            ColumnarStore([1, 2], [1])
+
+    def test_setitem_append_and_insert(self):
+        store = ColumnarStore()
+        for i in [0, 2, 3, 1]:
+            store[CURRENT + i * ONEHOUR] = i
+        assert list(store.keys()) == [CURRENT + i * ONEHOUR for i in range(4)]
+        assert list(store.values()) == [0, 1, 2, 3]
+        assert store.dtype == np.int64
+
+    def test_iter_views_yield_python_objects(self):
+        store = ColumnarStore([1, 2], [1.5, 2.5], tz="Europe/Paris")
+        assert list(store.values()) == [1.5, 2.5]
+        assert not any(isinstance(value, np.generic) for value in store.values())
+        assert list(store.items()) == [
+            (pd.Timestamp(1, tz="Europe/Paris"), 1.5),
+            (pd.Timestamp(2, tz="Europe/Paris"), 2.5),
+        ]
+
+    def test_setitem_grows_capacity_amortized(self):
+        store = ColumnarStore()
+        for i in range(100):
+            store[CURRENT + i * ONEHOUR] = float(i)
+        assert len(store) == 100
+        assert len(store._keys) == 128
+
+    def test_setitem_promotes_dtype(self):
+        store = ColumnarStore()
+        store[CURRENT] = 1
+        store[CURRENT + ONEHOUR] = 1.5
+        assert store.dtype == np.float64
+        store[CURRENT + 2 * ONEHOUR] = "foo"
+        assert store.dtype == object
+        assert store[CURRENT + 2 * ONEHOUR] == "foo"
+
+    def test_setitem_keeps_booleans_mixed_with_numbers(self):
+        store = ColumnarStore([1, 2], [True, False])
+        store[pd.Timestamp(3, tz="UTC")] = 5
+        assert store.dtype == object
+        assert list(store.values()) == [True, False, 5]
+        assert isinstance(store[pd.Timestamp(1, tz="UTC")], bool)
+
+    def test_delitem(self):
+        store = ColumnarStore([1, 2, 3], [1, 2, 3])
+        del store[pd.Timestamp(2, tz="UTC")]
+        assert store.int_keys.tolist() == [1, 3]
+        with pytest.raises(KeyError):
+            del store[pd.Timestamp(2, tz="UTC")]
+
+    def test_delete_slice_of_keys(self):
+        store = ColumnarStore([1, 2, 3, 4], [1, 2, 3, 4])
+        del store.keys()[1:3]
+        assert store.int_keys.tolist() == [1, 4]
+        assert store.array_values.tolist() == [1, 4]
+
+    def test_update_merges_and_promotes(self):
+        store = ColumnarStore([1, 3], [1, 3])
+        store.update({pd.Timestamp(i, tz="UTC"): i + 0.5 for i in range(2, 40)})
+        assert store.int_keys.tolist() == [1, *range(2, 40)]
+        assert store[pd.Timestamp(3, tz="UTC")] == 3.5
+        assert store.dtype == np.float64
+
+    def test_extend_appends_in_place(self):
+        store = ColumnarStore()
+        for i in range(0, 100, 10):
+            store.extend(range(i, i + 10), [float(j) for j in range(i, i + 10)])
+        assert store.int_keys.tolist() == list(range(100))
+        assert store.dtype == np.float64
+        assert len(store._keys) == 128
+
+    def test_extend_merges_overlapping_keys(self):
+        store = ColumnarStore([1, 3, 5], [1, 3, 5])
+        store.extend([6, 2, 3], [6, 2, 30])
+        assert store.int_keys.tolist() == [1, 2, 3, 5, 6]
+        assert store.array_values.tolist() == [1, 2, 30, 5, 6]
+
+    def test_bisect_and_irange(self, columnarts, smallts):
+        for key in [CURRENT, CURRENT + HALFHOUR, CURRENT + 9 * ONEHOUR]:
+            assert columnarts.data.bisect_left(key) == smallts.data.bisect_left(key)
+            assert columnarts.data.bisect_right(key) == smallts.data.bisect_right(key)
+
+        start, end = CURRENT + HALFHOUR, CURRENT + 4 * ONEHOUR
+        expected = list(smallts.data.irange(start, end, inclusive=(True, False)))
+        result = list(columnarts.data.irange(start, end, inclusive=(True, False)))
+        assert result == expected
+
+    def test_equals_sorteddict(self, columnarts, smallts):
+        assert columnarts.data == smallts.data
+        assert smallts.data == columnarts.data
+
+
+class TestColumnarTimeSeries:
+    def test_init_from_dict(self, columnarts, smallts):
+        assert columnarts.storage == "columnar"
+        testing.assert_ts_equal(columnarts, smallts)
+
+    def test_init_from_series(self, smalldict):
+        serie = pd.Series(smalldict, name="SomeName", dtype=float)
+        ts = TimeSeries(serie, storage="columnar")
+        assert ts.storage == "columnar"
+        assert ts.name == "SomeName"
+        assert ts[CURRENT + ONEHOUR] == 1.0
+
+    @pytest.mark.parametrize("values", [["foo", 1], [True, 2], [[1], [1, 2]]])
+    def test_init_falls_back_on_sorteddict_for_objects(self, values):
+        ts = TimeSeries(
+            dict(zip([CURRENT, CURRENT + ONEHOUR], values)), storage="columnar"
+        )
+        assert ts.storage == "sorteddict"
+        assert list(ts.values()) == values
+
+    def test_init_with_unknown_storage_raises(self):
+        with pytest.raises(ValueError):
+            TimeSeries(storage="unknown")
+
+    def test_init_from_timeseries_converts_storage(self, smallts):
+        ts = TimeSeries(smallts, storage="columnar")
+        assert ts.storage == "columnar"
+        testing.assert_ts_equal(ts, smallts)
+
+    @pytest.mark.parametrize("interpolate", ["previous", "linear"])
+    def test_getitem(self, columnarts, smallts, interpolate):
+        for key in [
+            CURRENT - ONEHOUR,
+            CURRENT,
+            CURRENT + HALFHOUR,
+            CURRENT + 20 * ONEHOUR,
+        ]:
+            assert columnarts[key, interpolate] == smallts[key, interpolate]
+
+    def test_bounds(self, columnarts, smallts):
+        assert columnarts.lower_bound == smallts.lower_bound
+        assert columnarts.upper_bound == smallts.upper_bound
+
+    def test_slice_keeps_storage(self, columnarts, smallts):
+        sliced = columnarts[CURRENT + HALFHOUR : CURRENT + 3 * ONEHOUR]
+        assert sliced.storage == "columnar"
+        testing.assert_ts_equal(
+            sliced, smallts[CURRENT + HALFHOUR : CURRENT + 3 * ONEHOUR]
+        )
+
+    def test_items_and_index(self, columnarts, smallts):
+        assert columnarts.items() == smallts.items()
+        assert list(columnarts.index) == list(smallts.index)
+        assert columnarts.index[-5:] == smallts.index[-5:]
+
+    def test_deepcopy(self, columnarts):
+        copied = deepcopy(columnarts)
+        copied[CURRENT] = 1000
+        assert columnarts[CURRENT] == 0
+        assert copied.storage == "columnar"
+
+    def test_tz_convert(self, columnarts):
+        ts = columnarts.tz_convert("CET")
+        assert ts.tz == "CET"
+        assert columnarts.tz == "UTC"
+        assert ts.index[0] == CURRENT
+
+    @pytest.mark.parametrize("tz", ["UTC", "CET"])
+    def test_to_series_and_serialize(self, columnarts, smallts, tz):
+        columnarts, smallts = columnarts.tz_convert(tz), smallts.tz_convert(tz)
+        pd.testing.assert_series_equal(columnarts.to_series(), smallts.to_series())
+        for date_format in ["epoch", "iso"]:
+            assert columnarts.serialize(date_format) == smallts.serialize(date_format)
+
+    def test_to_series_is_a_copy(self, columnarts):
+        series = columnarts.to_series()
+        series.iloc[0] = 1000
+        assert columnarts[CURRENT] == 0
+
+
+class TestColumnarView:
+    @pytest.mark.parametrize(
+        "start, end",
+        [
+            (CURRENT, CURRENT + 3 * ONEHOUR),
+            (CURRENT + HALFHOUR, CURRENT + 3 * ONEHOUR),
+            (CURRENT - ONEHOUR, CURRENT + HALFHOUR),
+            (CURRENT + 12 * ONEHOUR, CURRENT + 13 * ONEHOUR),
+        ],
+    )
+    def test_view_equals_copy(self, columnarts, smallts, start, end):
+        view = columnarts.slice(start, end, copy=False)
+        testing.assert_ts_equal(view, smallts.slice(start, end))
+        testing.assert_ts_equal(view, columnarts.slice(start, end))
+
+    def test_view_shares_values(self, columnarts):
+        view = columnarts.slice(CURRENT + HALFHOUR, CURRENT + 3 * ONEHOUR, copy=False)
+        assert np.shares_memory(view.data.array_values, columnarts.data.array_values)
+
+    def test_view_is_copied_on_mutation(self, columnarts):
+        view = columnarts.slice(CURRENT, CURRENT + 3 * ONEHOUR, copy=False)
+        view[CURRENT] = 1000
+        assert columnarts[CURRENT] == 0
+        assert view[CURRENT] == 1000
+        assert not np.shares_memory(view.data.int_keys, columnarts.data.int_keys)
+
+    def test_parent_is_copied_on_mutation(self, columnarts):
+        view = columnarts.slice(CURRENT, CURRENT + 3 * ONEHOUR, copy=False)
+        columnarts[CURRENT + HALFHOUR] = 1000
+        del columnarts[CURRENT]
+        assert list(view.values()) == [0, 1, 2]
+        assert list(view.index) == [CURRENT + i * ONEHOUR for i in range(3)]
+
+    def test_view_arrays_are_read_only(self, columnarts):
+        view = columnarts.slice(CURRENT, CURRENT + 3 * ONEHOUR, copy=False)
+        with pytest.raises(ValueError):
+            view.data.array_values[0] = 1000
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from tests.conftest import CURRENT, ONEHOUR
+from ticts import TimeSeries, TimeSeriesStore, testing
+
+
+@pytest.fixture
+def longts():
+    index = pd.date_range("2019-01-01", "2019-06-30", freq="7h", tz="CET")
+    serie = pd.Series(range(len(index)), index=index, name="SomeName")
+    return TimeSeries(serie, default=-1)
+
+
+@pytest.fixture
+def store(tmpdir, longts):
+    store = TimeSeriesStore(tmpdir.join("store"))
+    store.append(longts)
+    return store
+
+
+class TestTimeSeriesStore:
+    def test_partitions(self, store):
+        assert [str(period) for period in store.partitions] == [
+            f"2019-0{i}" for i in range(1, 7)
+        ]
+
+    def test_read_all(self, store, longts):
+        ts = store.read()
+        assert ts.tz == "CET"
+        testing.assert_ts_equal(ts, longts)
+
+    def test_reopen(self, store, longts):
+        testing.assert_ts_equal(TimeSeriesStore(store.path).read(), longts)
+
+    @pytest.mark.parametrize(
+        "start, end",
+        [
+            ("2019-03-01", "2019-04-01"),
+            ("2019-02-28T23:00:00", "2019-03-15"),
+            ("2019-03-01T00:30:00", "2019-03-01T01:00:00"),
+            ("2018-12-01", "2019-01-02"),
+            ("2019-06-29", None),
+            (None, "2019-01-03"),
+            ("2019-03-01T04:00:00", "2019-03-01T04:00:00"),
+            ("2019-03-01T05:00:00", "2019-02-01"),
+        ],
+    )
+    def test_read_range_equals_slice(self, store, longts, start, end):
+        ts = store.read(start, end, storage="columnar")
+        expected = longts.slice(start or longts.lower_bound, end or "2020-01-01")
+        testing.assert_ts_equal(ts, expected)
+
+    def test_read_range_of_empty_store(self, tmpdir):
+        store = TimeSeriesStore(tmpdir.join("store"))
+        expected = TimeSeries().slice(CURRENT, CURRENT + ONEHOUR)
+        testing.assert_ts_equal(store.read(CURRENT, CURRENT + ONEHOUR), expected)
+
+    def test_weekly_partitions(self, tmpdir, longts):
+        store = TimeSeriesStore(tmpdir.join("store"), freq="W")
+        store.append(longts)
+        assert len(store.partitions) == 26
+        assert str(store.partitions[0]) == "2018-12-31/2019-01-06"
+        testing.assert_ts_equal(TimeSeriesStore(store.path).read(), longts)
+
+    def test_read_range_loads_partitions_needed(self, store, mocker):
+        read_partition = mocker.spy(store, "_read_partition")
+        store.read("2019-03-01T00:30:00", "2019-03-10")
+        assert [str(call.args[0]) for call in read_partition.call_args_list] == [
+            "2019-03",
+            "2019-02",
+        ]
+
+    def test_append(self, tmpdir, longts):
+        store = TimeSeriesStore(tmpdir.join("store"))
+        split = longts.index[300]  # in March
+        store.append(longts.slice(longts.lower_bound, split))
+        path = store.path / "2019-01-01T00-00-00.bin"
+        last_modified = path.stat().st_mtime_ns
+
+        store.append(longts.slice(split, "2020-01-01"))
+        assert path.stat().st_mtime_ns == last_modified
+        testing.assert_ts_equal(store.read(), longts)
+
+    def test_append_before_upper_bound_raises(self, store):
+        with pytest.raises(ValueError):
+            store.append(TimeSeries({CURRENT + ONEHOUR: 1}))
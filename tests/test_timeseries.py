@@ -1,7 +1,9 @@
+import pickle
 from copy import copy, deepcopy
 from datetime import datetime
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -119,6 +121,20 @@ class TestTictsMagicMixin:
         deepcopied = deepcopy(smallts_withdefault)
         testing.assert_ts_equal(deepcopied, smallts_withdefault)
 
+    # Pickle
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_pickle(self, smalldict, storage):
+        ts = TimeSeries(smalldict, name="pickled", storage=storage, tz="CET")
+        unpickled = pickle.loads(pickle.dumps(ts))
+        testing.assert_ts_equal(unpickled, ts)
+        assert unpickled.storage == storage
+        assert not unpickled._has_default
+
+    def test_pickle_with_default(self, smallts_withdefault):
+        unpickled = pickle.loads(pickle.dumps(smallts_withdefault))
+        testing.assert_ts_equal(unpickled, smallts_withdefault)
+
     # Repr
 
     def test_repr_on_otherts(self, otherts):
@@ -241,6 +257,36 @@ def test_timeseries_compact(smallts):
     assert (CURRENT + ONEMIN) not in smallts.compact().index
 
 
+class TestTimeSeriesCompact:
+    dct = {
+        CURRENT + i * ONEHOUR: value for i, value in enumerate([1, 1, 2, 2, 1, 3, 3])
+    }
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_compact(self, storage):
+        ts = TimeSeries(self.dct, default=1, storage=storage)
+        compacted = ts.compact()
+        assert compacted.storage == storage
+        assert compacted.default == 1
+        assert list(compacted.values()) == [1, 2, 1, 3]
+        assert list(compacted.index) == [CURRENT + i * ONEHOUR for i in [0, 2, 4, 5]]
+        assert len(ts) == len(self.dct)
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_compact_inplace(self, storage):
+        ts = TimeSeries(self.dct, storage=storage)
+        expected = ts.compact()
+        assert ts.compact(inplace=True) is None
+        testing.assert_ts_equal(ts, expected)
+
+    def test_compact_on_objects(self):
+        ts = TimeSeries({CURRENT: "a", CURRENT + ONEHOUR: "a", CURRENT + ONEMIN: "b"})
+        assert list(ts.compact().values()) == ["a", "b", "a"]
+
+    def test_compact_on_empty(self, emptyts):
+        assert emptyts.compact().empty
+
+
 class TestTimeSeriesGetitem:
     available_interpolate = ["previous", "linear"]
 
@@ -356,6 +402,14 @@ class TestTimeSeriesGetitem:
         expected_ts = TimeSeries(data, default=smallts.default)
         testing.assert_ts_equal(sliced_ts, expected_ts)
 
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_slice_with_start_equal_to_end(self, smalldict, storage):
+        ts = TimeSeries(smalldict, storage=storage)
+        for start in [CURRENT + ONEHOUR, CURRENT + ONEHOUR + HALFHOUR]:
+            expected_ts = TimeSeries({start: ts[start]}, storage=storage)
+            testing.assert_ts_equal(ts.slice(start, start), expected_ts)
+            testing.assert_ts_equal(ts.slice(start, start - ONEHOUR), expected_ts)
+
     def test_get_on_slice_entirely_out_of_bounds_on_left_side(self, smallts):
         assert smallts[CURRENT - 2 * ONEHOUR : CURRENT - 1 * ONEHOUR].empty
 
@@ -381,6 +435,102 @@ class TestTimeSeriesGetitem:
         testing.assert_ts_equal(sliced_ts, expected_ts)
 
 
+class TestTimeSeriesAt:
+    keys = pd.date_range(CURRENT - ONEHOUR, CURRENT + 11 * ONEHOUR, freq="13min")
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    @pytest.mark.parametrize("interpolate", ["previous", "linear"])
+    def test_at_is_equivalent_to_getitem(self, smalldict, storage, interpolate):
+        for ts in [
+            TimeSeries(smalldict, storage=storage),
+            TimeSeries(smalldict, default=10, storage=storage),
+        ]:
+            expected = [ts[key, interpolate] for key in self.keys]
+            assert list(ts.at(self.keys, interpolate)) == expected
+
+    def test_at_with_strings(self, smallts):
+        values = smallts.at(["2019-01-01", "2019-01-01T01:30:00"])
+        assert values.tolist() == [0, 1]
+
+    def test_at_as_series(self, smallts):
+        series = smallts.at(self.keys, as_series=True)
+        assert isinstance(series, pd.Series)
+        assert series.name == smallts.name
+        assert (series.index == self.keys).all()
+
+    def test_at_out_of_left_bound_not_permissive_raises(self, smallts):
+        smallts.permissive = False
+        with pytest.raises(KeyError) as err:
+            smallts.at(self.keys)
+        assert "default attribute is not set" in str(err.value)
+
+    def test_at_on_empty(self, emptyts, emptyts_withdefault):
+        assert emptyts.at([CURRENT]).tolist() == [None]
+        assert emptyts_withdefault.at([CURRENT]).tolist() == [10]
+
+    def test_at_unknown_interpolate_raises(self, smallts):
+        with pytest.raises(ValueError):
+            smallts.at([CURRENT], "unknown")
+
+
+@pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+def test_mixed_type_values_are_kept(storage):
+    keys = [CURRENT, CURRENT + ONEHOUR, CURRENT + 2 * ONEHOUR]
+    ts = TimeSeries(dict(zip(keys, [1, "a", True])), storage=storage)
+
+    assert ts.at(keys).tolist() == [1, "a", True]
+    assert list(ts.sample(ONEHOUR).values()) == [1, "a", True]
+    assert list(pickle.loads(pickle.dumps(ts)).values()) == [1, "a", True]
+
+    other = TimeSeries({CURRENT: 1}, storage=storage)
+    assert list((ts == other).values()) == [True, False, True]
+
+
+def test_ragged_list_values_are_kept():
+    keys = [CURRENT, CURRENT + ONEHOUR]
+    ts = TimeSeries(dict(zip(keys, [[1], [1, 2]])))
+
+    assert ts.at(keys).tolist() == [[1], [1, 2]]
+    assert list(ts.sample(ONEHOUR).values()) == [[1], [1, 2]]
+    assert list(pickle.loads(pickle.dumps(ts)).values()) == [[1], [1, 2]]
+    assert list(ts.compact().values()) == [[1], [1, 2]]
+    assert list((ts + ts).values()) == [[1, 1], [1, 2, 1, 2]]
+    assert ts.reader()[CURRENT + ONEHOUR] == [1, 2]
+    assert ts.tz_convert("CET")[CURRENT] == [1]
+
+
+class TestTimeSeriesAppend:
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_append_equals_setitem(self, smalldict, storage):
+        ts = TimeSeries(storage=storage)
+        for key, value in smalldict.items():
+            ts.append(key, value)
+        ts.append("2019-01-01T00:30:00", 1000)
+
+        expected = TimeSeries(smalldict)
+        expected["2019-01-01T00:30:00"] = 1000
+        testing.assert_ts_equal(ts, expected)
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_extend_equals_setitem(self, smallts, smalldict, storage):
+        ts = TimeSeries(smallts, storage=storage)
+        keys = [CURRENT + 9 * ONEHOUR + i * HALFHOUR for i in range(1, 5)]
+        ts.extend(keys, [10, 11, 12, 13])
+        ts.extend(["2019-01-01T00:30:00", CURRENT], [1000, 2000])
+
+        expected = TimeSeries(smalldict)
+        for key, value in zip(keys, [10, 11, 12, 13]):
+            expected[key] = value
+        expected["2019-01-01T00:30:00"] = 1000
+        expected[CURRENT] = 2000
+        assert ts.storage == storage
+        testing.assert_ts_equal(ts, expected)
+
+    def test_extend_with_different_lengths_raises(self, smallts):
+        with pytest.raises(ValueError):
+            smallts.extend([CURRENT], [1, 2])
+
+
 class TestTimeSeriesSetInterval:
     def test_set_interval_when_no_default_raises(self, smallts):
         with pytest.raises(NotImplementedError):
@@ -510,6 +660,46 @@ class TestTimeSeriesSetInterval:
             assert emptyts[key] == expected_dct[key]
 
 
+class TestTimeSeriesSetIntervals:
+    INTERVALS = (
+        (CURRENT + ONEMIN, CURRENT + 2 * ONEHOUR, 1000),
+        (CURRENT + 2 * ONEHOUR, CURRENT + 3 * ONEHOUR + HALFHOUR, 2000),
+        (CURRENT + 5 * ONEHOUR, CURRENT + 12 * ONEHOUR, 3000),
+        (CURRENT - 2 * ONEHOUR, CURRENT - ONEHOUR, 4000),
+    )
+
+    def test_set_intervals_when_no_default_raises(self, smallts):
+        with pytest.raises(NotImplementedError):
+            smallts.set_intervals([CURRENT], [CURRENT + ONEHOUR], [1000])
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_set_intervals_equals_consecutive_set_interval(
+        self, smallts_withdefault, storage
+    ):
+        expected = deepcopy(smallts_withdefault)
+        for start, end, value in self.INTERVALS:
+            expected.set_interval(start, end, value)
+
+        ts = TimeSeries(smallts_withdefault, storage=storage)
+        ts.set_intervals(*zip(*self.INTERVALS))
+        assert ts.storage == storage
+        testing.assert_ts_equal(ts, expected)
+
+    @pytest.mark.parametrize(
+        "starts, ends",
+        (
+            ([CURRENT, CURRENT + HALFHOUR], [CURRENT + ONEHOUR, CURRENT + 2 * ONEHOUR]),
+            ([CURRENT], [CURRENT]),
+            ([CURRENT, CURRENT + ONEHOUR], [CURRENT + ONEHOUR]),
+        ),
+    )
+    def test_set_intervals_on_invalid_intervals_raises(
+        self, smallts_withdefault, starts, ends
+    ):
+        with pytest.raises(ValueError):
+            smallts_withdefault.set_intervals(starts, ends, [1000] * len(starts))
+
+
 class TestIterIntervals:
     def test_simple_iterintervals(self, smallts):
         iterator = smallts.iterintervals()
@@ -529,6 +719,35 @@ class TestIterIntervals:
         expected.append((CURRENT + 3 * ONEHOUR, end))
         assert sorted(result) == sorted(expected)
 
+    def test_iterintervals_with_end_on_key_or_out_of_bounds(self, smallts):
+        assert len(list(smallts.iterintervals(CURRENT + 3 * ONEHOUR))) == 3
+        assert list(smallts.iterintervals(CURRENT - ONEHOUR)) == []
+        assert len(list(smallts.iterintervals(CURRENT + 20 * ONEHOUR))) == 10
+
+
+class TestIntervals:
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    @pytest.mark.parametrize("end", [None, CURRENT + 3 * ONEHOUR + HALFHOUR])
+    def test_intervals_equals_iterintervals(self, smalldict, storage, end):
+        ts = TimeSeries(smalldict, storage=storage)
+        starts, ends, durations, values = ts.intervals(end)
+        assert list(zip(starts, ends)) == list(ts.iterintervals(end))
+        assert list(durations) == [end - start for start, end in zip(starts, ends)]
+        assert list(values) == [ts[start] for start in starts]
+
+    def test_intervals_as_dataframe(self, smallts):
+        end = CURRENT + 3 * ONEHOUR + HALFHOUR
+        df = smallts.intervals(end, as_dataframe=True)
+        assert list(df.columns) == ["start", "end", "duration", "value"]
+        assert len(df) == 4
+        assert df["end"].iloc[-1] == end
+        assert df["duration"].iloc[-1] == HALFHOUR
+        assert df["value"].tolist() == [0, 1, 2, 3]
+
+    def test_intervals_empty(self, emptyts):
+        starts, ends, durations, values = emptyts.intervals()
+        assert len(starts) == len(ends) == len(durations) == len(values) == 0
+
 
 class TestTzConvert:
     def test_simple_tz_convert(self, smallts):
@@ -536,6 +755,34 @@ class TestTzConvert:
         assert ts.tz == "CET"
         assert smallts.tz == "UTC"
 
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_tz_convert_keeps_data_and_meta(self, smalldict, storage):
+        ts = TimeSeries(smalldict, default=10, name="tz", storage=storage)
+        converted = ts.tz_convert("America/New_York")
+        assert converted.tz == "America/New_York"
+        assert converted.storage == storage
+        assert converted.default == 10
+        assert converted.name == "tz"
+        assert list(converted.index) == list(ts.index)
+        assert converted.index[0].tz.zone == "America/New_York"
+        assert list(converted.values()) == list(ts.values())
+        # naive keys are localized in the new timezone
+        assert converted["2018-12-31 19:00"] == 0
+
+    def test_tz_convert_columnar_shares_arrays(self, smalldict):
+        ts = TimeSeries(smalldict, storage="columnar")
+        converted = ts.tz_convert("CET")
+        assert np.shares_memory(converted._as_arrays()[0], ts._as_arrays()[0])
+
+        converted[CURRENT] = 100
+        assert ts[CURRENT] == 0
+        assert ts.tz == "UTC"
+
+    def test_tz_of_empty_columnar_is_metadata(self):
+        ts = TimeSeries(tz="CET", storage="columnar")
+        assert ts.tz == "CET"
+        assert ts.tz_convert("Asia/Tokyo").tz == "Asia/Tokyo"
+
 
 def test_chain_operations_keep_meta_keys(smallts_withdefault):
     ts = smallts_withdefault
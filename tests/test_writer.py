@@ -0,0 +1,85 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from tests.conftest import CURRENT, ONEMIN
+from ticts import AsyncTimeSeriesWriter, TimeSeries
+
+
+async def _generate(count, shuffle=False):
+    order = range(count - 1, -1, -1) if shuffle else range(count)
+    for i in order:
+        yield CURRENT + i * ONEMIN, i
+
+
+@pytest.fixture(params=["sorteddict", "columnar"])
+def ts(request):
+    return TimeSeries(default=0, storage=request.param)
+
+
+class TestAsyncTimeSeriesWriter:
+    @pytest.mark.parametrize("shuffle", [False, True])
+    def test_consume(self, ts, shuffle):
+        async def main():
+            async with AsyncTimeSeriesWriter(ts, batch_size=7) as writer:
+                await writer.consume(_generate(50, shuffle=shuffle))
+
+        asyncio.run(main())
+        assert list(ts.index) == [CURRENT + i * ONEMIN for i in range(50)]
+        assert list(ts.values()) == list(range(50))
+
+    @pytest.mark.parametrize("storage", ["sorteddict", "columnar"])
+    def test_consume_into_other_timezone(self, storage):
+        ts = TimeSeries({CURRENT: 0}, storage=storage).tz_convert("Europe/Paris")
+
+        async def main():
+            async with AsyncTimeSeriesWriter(ts) as writer:
+                await writer.consume(_generate(3))
+                await writer.write("2019-01-01T12:00:00", 10)
+
+        asyncio.run(main())
+        expected_keys = [CURRENT + i * ONEMIN for i in range(3)]
+        expected_keys.append(pd.Timestamp("2019-01-01T12:00:00", tz="Europe/Paris"))
+        assert list(ts.index) == expected_keys
+        assert list(ts.values()) == [0, 1, 2, 10]
+
+    def test_last_value_wins(self, ts):
+        async def main():
+            async with AsyncTimeSeriesWriter(ts) as writer:
+                await writer.consume(
+                    [(CURRENT, 1), (CURRENT + ONEMIN, 2), (CURRENT, 3)]
+                )
+
+        asyncio.run(main())
+        assert ts[CURRENT] == 3
+
+    def test_commit_on_latency(self, ts):
+        async def main():
+            writer = AsyncTimeSeriesWriter(ts, batch_size=100, max_latency=0.01)
+            async with writer:
+                await writer.write(CURRENT, 1)
+                assert ts.empty
+                await asyncio.sleep(0.05)
+                assert ts[CURRENT] == 1
+
+        asyncio.run(main())
+
+    def test_backpressure(self, ts):
+        async def main():
+            writer = AsyncTimeSeriesWriter(ts, batch_size=2, max_pending=3)
+            writer.start()
+            await writer.consume(_generate(10))
+            assert writer.pending <= 3
+            await writer.close()
+
+        asyncio.run(main())
+        assert len(ts) == 10
+
+    def test_failing_commit(self, ts):
+        async def main():
+            async with AsyncTimeSeriesWriter(ts) as writer:
+                await writer.write("not a timestamp", 1)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(main())
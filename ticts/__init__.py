@@ -4,7 +4,14 @@ __version__ = metadata.version("ticts")
 
 import pandas as pd
 
+from ticts import parallel
+from ticts.aggregation import mean, reduce, sum
+from ticts.frame import TimeSeriesFrame
+from ticts.instrumentation import instrument, stats
+from ticts.lazy import LazyTimeSeries
+from ticts.store import TimeSeriesStore
 from ticts.timeseries import TimeSeries
+from ticts.writer import AsyncTimeSeriesWriter
 
 
 @pd.api.extensions.register_dataframe_accessor("to_ticts")
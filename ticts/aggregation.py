@@ -0,0 +1,88 @@
+"""N-ary aggregations of TimeSeries.
+
+Contrary to chaining binary operators (e.g. ``ts1 + ts2 + ts3``), the indexes of
+all TimeSeries are merged at once and no intermediate TimeSeries is built.
+"""
+
+import operator
+
+import numpy as np
+
+from ticts.operation import (
+    _align_for_operation,
+    _apply_operator,
+    _check_all_timeseries,
+    _get_default_for_operation,
+    _get_storage_for_operation,
+)
+from ticts.utils import NO_DEFAULT
+
+
+def _reduce(function, all_ts):
+    all_ts = list(all_ts)
+    if not all_ts:
+        raise TypeError("Can't aggregate an empty sequence of TimeSeries.")
+    _check_all_timeseries(all_ts)
+
+    keys, all_values = _align_for_operation(all_ts)
+    values = next(all_values)
+    for other_values in all_values:
+        values = _apply_operator(function, values, other_values)
+
+    default = _get_default_for_operation(function, all_ts)
+    return all_ts, keys, values, default
+
+
+def _build(all_ts, keys, values, default):
+    first = all_ts[0]
+    storage = _get_storage_for_operation(all_ts)
+    return first._from_arrays(
+        keys, values, tz=first.tz, storage=storage, default=default
+    )
+
+
+def reduce(function, all_ts):
+    """Apply function of two arguments cumulatively on TimeSeries, from left to
+    right, so as to reduce them to a single TimeSeries.
+
+    Equivalent to ``functools.reduce(lambda a, b: a._operate(b, function), all_ts)``.
+
+    Args:
+        function (callable): operator of two arguments, e.g. ``operator.add``.
+        all_ts (iterable of TimeSeries): TimeSeries to reduce.
+
+    Returns:
+        TimeSeries
+    """
+    return _build(*_reduce(function, all_ts))
+
+
+def sum(all_ts):
+    """Sum TimeSeries key by key.
+
+    Args:
+        all_ts (iterable of TimeSeries): TimeSeries to sum.
+
+    Returns:
+        TimeSeries
+    """
+    return reduce(operator.add, all_ts)
+
+
+def mean(all_ts):
+    """Average TimeSeries key by key.
+
+    Args:
+        all_ts (iterable of TimeSeries): TimeSeries to average.
+
+    Returns:
+        TimeSeries
+    """
+    all_ts, keys, values, default = _reduce(operator.add, all_ts)
+
+    count = np.full(len(values), len(all_ts))
+    values = _apply_operator(operator.truediv, values, count)
+    if default != NO_DEFAULT:
+        default = default / len(all_ts)
+
+    return _build(all_ts, keys, values, default)
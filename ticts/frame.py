@@ -0,0 +1,377 @@
+"""Several TimeSeries aligned on a shared index.
+
+A :class:`TimeSeriesFrame` keeps the union of the keys of its columns as one
+int64 epoch nanoseconds array, and the forward-filled values of each column on
+it. Columns keep their own meta keys (default, name, permissive, storage), and
+are aligned once when added, instead of on each operation.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from ticts.operation import (
+    _apply_operator,
+    _forward_fill_positions,
+    _merge_indexes,
+)
+from ticts.pandas_mixin import _get_sampling_grid
+from ticts.storage import infer_value_dtype, promote_value_types, to_datetimeindex
+from ticts.timeseries import TimeSeries
+from ticts.utils import (
+    NO_DEFAULT,
+    operation_factory,
+    timestamp_converter,
+    timestamps_converter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _get_column_default(operator, meta, other_meta=None, value=None):
+    if meta["default"] is NO_DEFAULT:
+        return NO_DEFAULT
+    if other_meta is not None:
+        if other_meta["default"] is NO_DEFAULT:
+            return NO_DEFAULT
+        value = other_meta["default"]
+
+    try:
+        return operator(meta["default"], value)
+    except ZeroDivisionError:
+        msg = "Can't compute the resulting default of '{}', dividing by 0."
+        logger.warning(msg.format(meta["name"]))
+        return NO_DEFAULT
+
+
+class TimeSeriesFrame:
+    """TimeSeries sharing one index, the union of their keys.
+
+    Columns are read as TimeSeries, and follow their step function
+    ("previous" interpolation) on the shared index: a column is defined from
+    its first key on, its default (if any) holding before.
+
+    Args:
+        data (dict or list of TimeSeries): columns, named after the keys of the
+            dict or the names of the TimeSeries.
+        tz (str): timezone of the index, default to the one of the first column.
+
+    Example:
+        >>> frame = TimeSeriesFrame({"power": power, "price": price})
+        >>> (frame * 2).sample("1h").to_dataframe()
+    """
+
+    def __init__(self, data=None, tz=None):
+        if data is None:
+            data = {}
+        if not hasattr(data, "items"):
+            data = list(data)
+            names = [ts.name for ts in data]
+            if len(set(names)) != len(names):
+                raise ValueError(f"Columns names should be unique, got {names}.")
+            data = dict(zip(names, data))
+
+        for name, ts in data.items():
+            if not isinstance(ts, TimeSeries):
+                raise TypeError(f"Column '{name}' is not of type TimeSeries.")
+
+        self.tz = tz or (str(next(iter(data.values())).tz) if data else "UTC")
+
+        all_arrays = [ts._as_arrays() for ts in data.values()]
+        if all_arrays:
+            self.keys, all_ranks = _merge_indexes(*[index for index, _ in all_arrays])
+        else:
+            self.keys, all_ranks = np.empty(0, dtype=np.int64), []
+
+        # Values of each column from its first key on
+        self._columns = {}
+        self._meta = {}
+        for (name, ts), (_, values), ranks in zip(data.items(), all_arrays, all_ranks):
+            positions = _forward_fill_positions(ranks, len(self.keys))
+            start = ranks[0] if len(ranks) else len(self.keys)
+            self._columns[name] = values[positions[start:]]
+            self._meta[name] = {**ts._kwargs_special_keys, "name": name}
+
+    @classmethod
+    def _from_columns(cls, keys, columns, meta, tz):
+        frame = cls(tz=tz)
+        frame.keys = keys
+        frame._columns = columns
+        frame._meta = meta
+        return frame
+
+    def __repr__(self):
+        header = f"<TimeSeriesFrame> (columns={self.columns})"
+        return f"{header}\n{self.to_dataframe()}"
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    @property
+    def index(self):
+        return to_datetimeindex(self.keys, self.tz)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def _start(self, name):
+        """Position of the first key of a column in the shared index."""
+        return len(self.keys) - len(self._columns[name])
+
+    def _get_values(self, name, start):
+        """Values of a column from position start on, its default filling the
+        positions before its first key."""
+        values = self._columns[name]
+        column_start = self._start(name)
+        if start >= column_start:
+            return values[start - column_start :]
+
+        default = self._meta[name]["default"]
+        if default is NO_DEFAULT:
+            msg = "Column '{}' is not defined before {} and has no default."
+            raise KeyError(msg.format(name, self.index[column_start]))
+
+        dtype = promote_value_types(values.dtype, infer_value_dtype(default))
+        prefix = np.full(column_start - start, default, dtype=dtype)
+        return np.concatenate((prefix, values.astype(dtype)))
+
+    def _get_defined_start(self, name):
+        """Position from which a column is defined, with its default or not."""
+        if self._meta[name]["default"] is NO_DEFAULT:
+            return self._start(name)
+        return 0
+
+    def __getitem__(self, name):
+        """Get a column as a TimeSeries on the shared index."""
+        if name not in self._columns:
+            raise KeyError(f"Column '{name}' not found in {self.columns}.")
+
+        meta = dict(self._meta[name])
+        storage = meta.pop("storage")
+        start = self._start(name)
+        return TimeSeries._from_arrays(
+            self.keys[start:], self._columns[name], tz=self.tz, storage=storage, **meta
+        )
+
+    def __setitem__(self, name, ts):
+        """Add or replace a column, aligning the index once."""
+        if not isinstance(ts, TimeSeries):
+            raise TypeError(f"Column '{name}' is not of type TimeSeries.")
+
+        index, values = ts._as_arrays()
+        keys, (ranks, column_ranks) = _merge_indexes(self.keys, index)
+        frame = self._reindex(keys, _forward_fill_positions(ranks, len(keys)))
+
+        positions = _forward_fill_positions(column_ranks, len(keys))
+        start = column_ranks[0] if len(column_ranks) else len(keys)
+        frame._columns[name] = values[positions[start:]]
+        frame._meta[name] = {**ts._kwargs_special_keys, "name": name}
+
+        self.keys, self._columns, self._meta = frame.keys, frame._columns, frame._meta
+
+    def __delitem__(self, name):
+        del self._columns[name]
+        del self._meta[name]
+
+    def _reindex(self, keys, positions):
+        """Build a frame on keys, positions being for each of them the position
+        of the last key lower or equal to it in the shared index (-1 if none),
+        non-decreasing."""
+        columns = {}
+        for name, values in self._columns.items():
+            column_start = self._start(name)
+            start = np.searchsorted(positions, column_start, side="left")
+            columns[name] = values[positions[start:] - column_start]
+        meta = {name: dict(meta) for name, meta in self._meta.items()}
+        return self._from_columns(keys, columns, meta, self.tz)
+
+    def _align(self, other):
+        """Return both frames on the union of their indexes."""
+        if np.array_equal(self.keys, other.keys):
+            return self, other
+
+        keys, (ranks, other_ranks) = _merge_indexes(self.keys, other.keys)
+        return (
+            self._reindex(keys, _forward_fill_positions(ranks, len(keys))),
+            other._reindex(keys, _forward_fill_positions(other_ranks, len(keys))),
+        )
+
+    def _operate(self, other, operator):
+        if isinstance(other, TimeSeries):
+            other = self.__class__({name: other for name in self.columns}, tz=self.tz)
+        if isinstance(other, self.__class__):
+            return self._operate_on_frame(other, operator)
+        return self._operate_on_scalar(other, operator)
+
+    def _operate_on_frame(self, other, operator):
+        if set(self.columns) != set(other.columns):
+            msg = "Can't operate on frames with different columns: {} and {}."
+            raise ValueError(msg.format(self.columns, other.columns))
+
+        left, right = self._align(other)
+        columns, meta = {}, {}
+        for name in left.columns:
+            start = max(left._get_defined_start(name), right._get_defined_start(name))
+            columns[name] = _apply_operator(
+                operator, left._get_values(name, start), right._get_values(name, start)
+            )
+            meta[name] = {
+                **left._meta[name],
+                "default": _get_column_default(
+                    operator, left._meta[name], right._meta[name]
+                ),
+            }
+        return self._from_columns(left.keys, columns, meta, self.tz)
+
+    def _operate_on_scalar(self, value, operator):
+        columns, meta = {}, {}
+        for name, values in self._columns.items():
+            scalars = np.full(len(values), value, dtype=infer_value_dtype(value))
+            columns[name] = _apply_operator(operator, values, scalars)
+            meta[name] = {
+                **self._meta[name],
+                "default": _get_column_default(operator, self._meta[name], value=value),
+            }
+        return self._from_columns(self.keys, columns, meta, self.tz)
+
+    __add__ = operation_factory("__add__")
+    __radd__ = operation_factory("__add__")
+    __sub__ = operation_factory("__sub__")
+
+    __mul__ = operation_factory("__mul__")
+    __truediv__ = operation_factory("__truediv__")
+    __floordiv__ = operation_factory("__floordiv__")
+
+    __lt__ = operation_factory("__lt__")
+    __le__ = operation_factory("__le__")
+    __gt__ = operation_factory("__gt__")
+    __ge__ = operation_factory("__ge__")
+    __eq__ = operation_factory("__eq__")
+
+    __or__ = operation_factory("__or__")
+    __xor__ = operation_factory("__xor__")
+    __and__ = operation_factory("__and__")
+
+    __hash__ = None
+
+    def floor(self, other):
+        """Floor all the columns, applying a min key by key.
+
+        Args:
+            other (TimeSeriesFrame, TimeSeries or numeric): values to floor on.
+
+        Returns:
+            TimeSeriesFrame floored
+        """
+        return self._operate(other, min)
+
+    def ceil(self, other):
+        """Ceil all the columns, applying a max key by key.
+
+        Args:
+            other (TimeSeriesFrame, TimeSeries or numeric): values to ceil on.
+
+        Returns:
+            TimeSeriesFrame ceiled
+        """
+        return self._operate(other, max)
+
+    def _at(self, keys):
+        """Frame on keys given as sorted int64 epoch nanoseconds."""
+        positions = np.searchsorted(self.keys, keys, side="right") - 1
+        return self._reindex(keys, positions)
+
+    def slice(self, start, end):  # A003
+        """Slice all the columns for given interval, as
+        :meth:`~ticts.timeseries.TimeSeries.slice` does.
+
+        Args:
+            start (datetime or str): lower bound
+            end (datetime or str): upper bound
+
+        Returns:
+            TimeSeriesFrame sliced
+        """
+        start = timestamp_converter(start, self.tz).value
+        end = timestamp_converter(end, self.tz).value
+
+        lo = np.searchsorted(self.keys, start, side="left")
+        hi = max(lo, np.searchsorted(self.keys, end, side="left"))
+        start_is_key = lo < len(self.keys) and self.keys[lo] == start
+        if start_is_key:  # kept even when end is not after start
+            hi = max(hi, lo + 1)
+        keys = self.keys[lo:hi]
+
+        # Add back the previous values on start if it is not a key and in bounds
+        if lo > 0 and not start_is_key:
+            keys = np.concatenate(([start], keys))
+            lo -= 1
+
+        return self._reindex(keys, np.arange(lo, lo + len(keys)))
+
+    def sample(self, freq=None, start=None, end=None, index=None):
+        """Sample all the columns into an evenly spaced frame, as
+        :meth:`~ticts.timeseries.TimeSeries.sample` does.
+
+        The grid is shared by the columns: as for a TimeSeries, it starts on
+        the first key at the earliest unless a column has a default, but a
+        column starting later is only sampled on the keys of the grid after its
+        first key.
+
+        Args:
+            freq (timedelta): frequency to convert in.
+            start (datetime): left bound, default to the first key.
+            end (datetime): right bound, default to the last key plus freq.
+            index (array-like): datetimes to sample on instead of a frequency.
+
+        Returns:
+            TimeSeriesFrame
+        """
+        if freq is None and index is None:
+            msg = (
+                "You should either select one frequency OR an index for "
+                "the sampling. Both are None."
+            )
+            raise ValueError(msg)
+
+        if index is not None:
+            return self._at(np.unique(timestamps_converter(index, self.tz)))
+
+        freq = to_offset(freq)
+        if self.empty:
+            return self._at(self.keys)
+
+        first, last = self.index[[0, -1]]
+        if start:
+            start = timestamp_converter(start, self.tz)
+            if all(meta["default"] is NO_DEFAULT for meta in self._meta.values()):
+                start = max(start, first)
+        else:
+            start = first
+        end = timestamp_converter(end, self.tz) if end else last + freq
+        return self._at(_get_sampling_grid(start, end, freq))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert into a pd.DataFrame, columns being filled with their default
+        (or NaN) before their first key."""
+        index = self.index
+        series = {}
+        for name, values in self._columns.items():
+            default = self._meta[name]["default"]
+            series[name] = pd.Series(values, index=index[self._start(name) :]).reindex(
+                index, fill_value=None if default is NO_DEFAULT else default
+            )
+        return pd.DataFrame(series, index=index)
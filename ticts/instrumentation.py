@@ -0,0 +1,186 @@
+"""Opt-in instrumentation of TimeSeries methods.
+
+When enabled, the public methods of TimeSeries, its main internal steps
+(operations, lookups) and the timestamp converters are replaced by wrappers
+recording their number of calls, their cumulative time and the number of
+points they processed. Disabling restores the original functions, so that
+instrumentation costs nothing when it is not enabled.
+
+Example:
+    >>> with ticts.instrument():
+    ...     ts1 + ts2
+    >>> ticts.stats()
+"""
+
+import functools
+import inspect
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import pandas as pd
+
+from ticts import utils
+from ticts.timeseries import TimeSeries
+
+# Internal methods instrumented on top of the public ones
+INSTRUMENTED_PRIVATE_METHODS = (
+    "__init__",
+    "__getitem__",
+    "__setitem__",
+    "_operate_on_ts",
+    "_operate_on_scalar",
+    "_lookup",
+    "_get_previous",
+    "_get_linear_interpolate",
+    "_from_arrays",
+    "_as_arrays",
+)
+INSTRUMENTED_FUNCTIONS = ("timestamp_converter", "timestamps_converter")
+# Methods processing one point, whatever the length of the TimeSeries
+SINGLE_POINT_METHODS = (
+    "__getitem__",
+    "__setitem__",
+    "_get_previous",
+    "_get_linear_interpolate",
+)
+
+_stats = defaultdict(lambda: [0, 0.0, 0])
+_hooks = []
+# Original attributes replaced, as (owner, name, original, was_own_attribute)
+_patched = []
+
+
+def _count_points(name, args, result):
+    if name.split(".")[-1] in SINGLE_POINT_METHODS:
+        return 1
+    if args and isinstance(args[0], TimeSeries):
+        return len(args[0])
+    if isinstance(result, TimeSeries):
+        return len(result)
+    if hasattr(result, "__len__") and not isinstance(result, (str, bytes, dict)):
+        return len(result)
+    return 1
+
+
+def _record(name, duration, points):
+    stats = _stats[name]
+    stats[0] += 1
+    stats[1] += duration
+    stats[2] += points
+    for hook in _hooks:
+        hook(name, duration, points)
+
+
+def _instrument(name, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            # Arguments might be half-built, e.g. self when __init__ raised
+            _record(name, time.perf_counter() - start, 0)
+            raise
+        _record(name, time.perf_counter() - start, _count_points(name, args, result))
+        return result
+
+    return wrapper
+
+
+def _get_instrumented_methods():
+    for name in dir(TimeSeries):
+        if name.startswith("_") and name not in INSTRUMENTED_PRIVATE_METHODS:
+            continue
+        attr = inspect.getattr_static(TimeSeries, name)
+        if isinstance(attr, (classmethod, staticmethod)) or inspect.isfunction(attr):
+            yield name, attr
+
+
+def is_enabled():
+    """Return whether the instrumentation is enabled."""
+    return bool(_patched)
+
+
+def enable(hook=None):
+    """Instrument TimeSeries methods and the timestamp converters.
+
+    Args:
+        hook (callable): called as ``hook(name, duration, points)`` after each
+            call instrumented, e.g. to forward them to a metrics exporter.
+    """
+    if hook is not None:
+        _hooks.append(hook)
+    if is_enabled():
+        return
+
+    for name, attr in _get_instrumented_methods():
+        qualname = f"TimeSeries.{name}"
+        if isinstance(attr, (classmethod, staticmethod)):
+            wrapper = type(attr)(_instrument(qualname, attr.__func__))
+        else:
+            wrapper = _instrument(qualname, attr)
+        _patched.append((TimeSeries, name, attr, name in TimeSeries.__dict__))
+        setattr(TimeSeries, name, wrapper)
+
+    # Functions are patched in every ticts module they were imported in
+    for name in INSTRUMENTED_FUNCTIONS:
+        original = getattr(utils, name)
+        wrapper = _instrument(name, original)
+        for module_name, module in list(sys.modules.items()):
+            if module_name.split(".")[0] != "ticts":
+                continue
+            if getattr(module, name, None) is original:
+                _patched.append((module, name, original, True))
+                setattr(module, name, wrapper)
+
+
+def disable():
+    """Restore the original methods and functions, and remove the hooks."""
+    while _patched:
+        owner, name, original, was_own_attribute = _patched.pop()
+        if was_own_attribute:
+            setattr(owner, name, original)
+        else:
+            delattr(owner, name)
+    _hooks.clear()
+
+
+def reset():
+    """Reset the statistics recorded."""
+    _stats.clear()
+
+
+@contextmanager
+def instrument(hook=None):
+    """Enable the instrumentation within a context.
+
+    Args:
+        hook (callable): called as ``hook(name, duration, points)`` after each
+            call instrumented.
+    """
+    was_enabled = is_enabled()
+    enable(hook)
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+        elif hook is not None:
+            _hooks.remove(hook)
+
+
+def stats():
+    """Return the statistics recorded since the last reset.
+
+    Returns:
+        pd.DataFrame indexed by the name of the methods and functions, with their
+        number of calls, cumulative time in seconds and number of points
+        processed, sorted by decreasing time.
+    """
+    df = pd.DataFrame.from_dict(
+        dict(_stats), orient="index", columns=["calls", "time", "points"]
+    )
+    df.index.name = "operation"
+    return df.sort_values("time", ascending=False)
@@ -1,10 +1,278 @@
+import codecs
 import json
+import logging
+import os
+import re
+import struct
+from contextlib import contextmanager
+from itertools import chain, islice
 from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
+from sortedcontainers import SortedDict
 
-from ticts.utils import NO_DEFAULT
+from ticts.storage import (
+    COLUMNAR,
+    NUMERIC_KINDS,
+    SORTEDDICT,
+    ColumnarStore,
+    to_datetimeindex,
+    to_values_array,
+)
+from ticts.utils import (
+    MAXTS,
+    MINTS,
+    NO_DEFAULT,
+    timestamp_converter,
+    timestamps_converter,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_IMPORTED = True
+except ImportError:
+    PYARROW_IMPORTED = False
+    MSG_ERROR_PYARROW = (
+        "'pyarrow' is not installed. "
+        "Parquet I/O is not available. "
+        "Install it by using:\npip install pyarrow"
+    )
+    logger.debug(MSG_ERROR_PYARROW)
+
+# Number of points serialized, or parsed, at once when streaming JSON.
+JSON_CHUNKSIZE = 10_000
+
+# Binary layout: magic, header length, JSON header padded to 8 bytes, then the
+# int64 epoch nanoseconds keys followed by the values, both little-endian.
+BINARY_MAGIC = b"TICTSBIN"
+BINARY_VERSION = 1
+_KEYS_DTYPE = np.dtype("<i8")
+
+
+def _read_binary_header(fh):
+    if fh.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError(f"'{fh.name}' is not a ticts binary file.")
+    (length,) = struct.unpack("<Q", fh.read(8))
+    header = json.loads(fh.read(length))
+    if header["version"] > BINARY_VERSION:
+        msg = "Binary format version {} is not supported."
+        raise ValueError(msg.format(header["version"]))
+    return header, fh.tell()
+
+
+def _read_binary_array(path, dtype, offset, size, mmap):
+    if size == 0:
+        return np.empty(0, dtype=dtype)
+    if mmap:
+        array = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(size,))
+        return array.view(np.ndarray)
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        return np.fromfile(fh, dtype=dtype, count=size)
+
+
+@contextmanager
+def _open_handle(path, mode, compression="infer"):
+    if hasattr(pd.io.common, "_get_handle"):
+        fh, _ = pd.io.common._get_handle(path, mode, compression=compression)
+        try:
+            yield fh
+        finally:
+            fh.close()
+    else:
+        handles = pd.io.common.get_handle(path, mode, compression=compression)
+        try:
+            yield handles.handle
+        finally:
+            handles.close()
+
+
+_JSON_KEY = re.compile(r'\s*"((?:[^"\\]|\\.)*)"\s*:\s*')
+_JSON_SEPARATOR = re.compile(r"\s*([,:}\]])")
+
+
+class _JSONStreamReader:
+    """Pull parser over a text or binary handle, reading it chunk by chunk.
+
+    Only the structure of the document is walked through here, values are
+    decoded with the scanner of :class:`json.JSONDecoder`.
+    """
+
+    def __init__(self, fh, chunksize=2**16):
+        self.fh = fh
+        self.chunksize = chunksize
+        self.buffer = ""
+        self.pos = 0
+        self.scan = json.JSONDecoder().scan_once
+        self.decoder = None
+
+    def _read(self):
+        """Read the next chunk as text, decoding bytes as json.load does."""
+        while True:
+            chunk = self.fh.read(self.chunksize)
+            if isinstance(chunk, str):
+                return chunk
+            if self.decoder is None:
+                encoding = json.detect_encoding(chunk)
+                self.decoder = codecs.getincrementaldecoder(encoding)()
+            # A chunk may end in the middle of a character
+            text = self.decoder.decode(chunk, final=not chunk)
+            if text or not chunk:
+                return text
+
+    def _fill(self):
+        chunk = self._read()
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _fill_or_raise(self):
+        if not self._fill():
+            raise ValueError("Unexpected end of the JSON document.")
+
+    def peek(self):
+        """Return the next non-whitespace character, without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            msg = "Expecting '{}' in JSON document, got '{}'."
+            raise ValueError(msg.format(char, self.peek()))
+        self.pos += 1
+
+    def _scan_value(self, pos):
+        """Decode the value at pos, followed by a separator.
+
+        Returns:
+            tuple of the value, the separator and the position after it, or None
+            if the buffer ends before.
+        """
+        try:
+            value, end = self.scan(self.buffer, pos)
+        except (StopIteration, json.JSONDecodeError):
+            return None
+        # A number might go on in the next chunk, so wait for the separator
+        separator = _JSON_SEPARATOR.match(self.buffer, end)
+        if separator is None:
+            return None
+        return value, separator.group(1), separator.end()
+
+    def value(self):
+        """Decode the next value, leaving its separator unconsumed."""
+        self.peek()
+        while (scanned := self._scan_value(self.pos)) is None:
+            self._fill_or_raise()
+        value, _, end = scanned
+        self.pos = end - 1
+        return value
+
+    def iter_keys(self):
+        """Iterate over the keys of an object, each value being consumed by the
+        caller before the next key."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == "}":
+                self.pos += 1
+                return
+            self.expect(",")
+
+    def iter_items(self):
+        """Iterate over the (key, value) pairs of an object, whose keys have
+        to be strings: this is the hot loop on the points of a TimeSeries."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = _JSON_KEY.match(self.buffer, self.pos)
+            scanned = key and self._scan_value(key.end())
+            if not scanned:
+                self._fill_or_raise()
+                continue
+
+            value, separator, self.pos = scanned
+            key = key.group(1)
+            yield (json.loads(f'"{key}"') if "\\" in key else key), value
+            if separator != ",":
+                self.pos -= 1
+                self.expect("}")
+                return
+
+
+def _parse_keys(keys, tz):
+    try:
+        return np.array(keys).astype(np.int64)
+    except ValueError:
+        return timestamps_converter(list(keys), tz)
+
+
+def _read_json_data(pairs, tz, storage):
+    """Build the storage from the (key, value) pairs, parsed by chunks."""
+    all_keys, all_values = [np.empty(0, dtype=np.int64)], []
+    pairs = iter(pairs)
+    while chunk := list(islice(pairs, JSON_CHUNKSIZE)):
+        keys, values = zip(*chunk)
+        all_keys.append(_parse_keys(keys, tz))
+        all_values.append(to_values_array(values) if storage == COLUMNAR else values)
+
+    keys = np.concatenate(all_keys)
+    if storage == COLUMNAR:
+        values = np.concatenate(all_values) if all_values else np.empty(0)
+        if values.dtype.kind in NUMERIC_KINDS:
+            return ColumnarStore(keys, values, tz=tz)
+        values = values.tolist()
+    else:
+        values = chain.from_iterable(all_values)
+    return SortedDict(zip(to_datetimeindex(keys, tz), values))
+
+
+# Key of the file metadata holding the meta keys of a TimeSeries in parquet.
+PARQUET_METADATA_KEY = b"ticts"
+
+
+def _select_row_groups(metadata, start, end):
+    """Return the row groups needed to slice on [start, end), given as int64
+    epoch nanoseconds, from the statistics of the timestamp column.
+
+    The last row group before start is kept for the value on start.
+    """
+    before, selected, first_min = [], [], None
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(0).statistics
+        if stats is None or not stats.has_min_max:
+            selected.append(i)
+        elif stats.min_raw >= end:
+            break
+        elif stats.max_raw < start:
+            before = [i]
+        else:
+            if not selected:
+                first_min = stats.min_raw
+            selected.append(i)
+
+    if first_min is not None and first_min <= start:
+        return selected
+    return before + selected
 
 
 class TictsIOMixin:
@@ -12,10 +280,18 @@ class TictsIOMixin:
         self,
         date_format: Literal["epoch", "iso", "isoformat"] = "epoch",
     ) -> dict[str, Any]:
+        # Columnar keys are converted in bulk rather than one by one
+        is_columnar = self.storage == COLUMNAR
         if date_format.lower() == "epoch":
-            keys = [key.value for key in self.index]
+            if is_columnar:
+                keys = self.data.int_keys.tolist()
+            else:
+                keys = [key.value for key in self.index]
         elif date_format.lower() in ["iso", "isoformat"]:
-            keys = [key.isoformat() for key in self.index]
+            index = self.index
+            if is_columnar:
+                index = to_datetimeindex(self.data.int_keys, self.tz)
+            keys = [key.isoformat() for key in index]
         else:
             msg = "Date serealize with date_format equal to '{}' is not implemented"
             raise NotImplementedError(msg.format(date_format))
@@ -28,7 +304,30 @@ class TictsIOMixin:
 
     serealize = serialize  # legacy (mispelled beforehand)
 
+    def _iter_json(self, chunksize=JSON_CHUNKSIZE):
+        """Serialize to JSON piece by piece, as ``json.dumps(self.serialize())``."""
+        yield '{"data": {'
+        all_keys, _ = self._as_arrays()
+        for start in range(0, len(self), chunksize):
+            stop = start + chunksize
+            keys = all_keys[start:stop].tolist()
+            data = json.dumps(dict(zip(keys, self.values()[start:stop])))
+            yield (", " if start else "") + data[1:-1]
+
+        meta = {
+            "default": self.default if self.default != NO_DEFAULT else "no_default",
+            "name": self.name,
+        }
+        yield "}, " + json.dumps(meta)[1:]
+
     def to_json(self, path_or_buf, date_format="epoch", compression="infer"):
+        """Write to JSON, streaming the points into the handle.
+
+        Args:
+            path_or_buf (str, Path, file-like or None): where to write, return the
+                document as a string if None.
+            compression (str): as in pandas, inferred from the path by default.
+        """
         stringify_path = (
             pd.io.common._stringify_path
             if hasattr(pd.io.common, "_stringify_path")
@@ -36,37 +335,178 @@ class TictsIOMixin:
         )
         path_or_buf = stringify_path(path_or_buf)
 
-        s = json.dumps(self.serealize())
-
         if isinstance(path_or_buf, str):
-            if hasattr(pd.io.common, "_get_handle"):
-                fh, _ = pd.io.common._get_handle(
-                    path_or_buf, "w", compression=compression
-                )
-                try:
-                    fh.write(s)
-                finally:
-                    fh.close()
-
-            else:
-                fh = pd.io.common.get_handle(path_or_buf, "w", compression=compression)
-                try:
-                    fh.handle.write(s)
-                finally:
-                    fh.close()
-
+            with _open_handle(path_or_buf, "w", compression=compression) as fh:
+                fh.writelines(self._iter_json())
         elif path_or_buf is None:
-            return s
+            return "".join(self._iter_json())
         else:
-            path_or_buf.write(s)
+            path_or_buf.writelines(self._iter_json())
 
     @classmethod
-    def from_json(cls, path):
-        if not hasattr(path, "read"):
+    def from_json(cls, path, storage=None):
+        """Read a TimeSeries from JSON, parsing the points incrementally.
+
+        Args:
+            path (str, Path or file-like): what to read, possibly compressed.
+            storage (str): storage of the TimeSeries, SortedDict by default.
+
+        Returns:
+            TimeSeries
+        """
+        if isinstance(path, (str, os.PathLike)):
             path = Path(path)
             if not path.exists():
                 raise Exception(f"'{path}' does not exists.")
-            path = open(path)
+            with _open_handle(str(path), "r") as fh:
+                return cls.from_json(fh, storage=storage)
+
+        reader = _JSONStreamReader(path)
+        data, content = SortedDict(), {}
+        for key in reader.iter_keys():
+            if key == "data":
+                pairs = reader.iter_items()
+                data = _read_json_data(pairs, "UTC", storage or SORTEDDICT)
+            else:
+                content[key] = reader.value()
+
+        ts = cls(**content)
+        ts.data = data
+        return ts
+
+    def to_binary(self, path):
+        """Write to a binary file of contiguous int64 keys and typed values.
+
+        Args:
+            path (str or Path): file to write to.
+
+        Raises:
+            TypeError: when values are not numeric or boolean.
+        """
+        keys, values = self._as_arrays()
+        if values.dtype.kind not in NUMERIC_KINDS:
+            msg = "Only numeric or boolean values can be written as binary, got {}."
+            raise TypeError(msg.format(values.dtype))
+
+        values = values.astype(values.dtype.newbyteorder("<"), copy=False)
+        header = json.dumps(
+            {
+                "version": BINARY_VERSION,
+                "size": len(keys),
+                "dtype": values.dtype.str,
+                "tz": str(self.tz),
+                "default": self.default if self.default != NO_DEFAULT else "no_default",
+                "name": self.name,
+            }
+        ).encode()
+        header += b" " * (-(len(BINARY_MAGIC) + 8 + len(header)) % 8)
+
+        with open(path, "wb") as fh:
+            fh.write(BINARY_MAGIC)
+            fh.write(struct.pack("<Q", len(header)))
+            fh.write(header)
+            keys.astype(_KEYS_DTYPE, copy=False).tofile(fh)
+            values.tofile(fh)
+
+    @classmethod
+    def from_binary(cls, path, mmap=False):
+        """Read a TimeSeries written by :meth:`to_binary`, with columnar storage.
+
+        Args:
+            path (str or Path): file to read from.
+            mmap (bool): whether to memory-map the file instead of reading it.
+                The arrays are then read-only and copied on the first mutation.
+
+        Returns:
+            TimeSeries
+        """
+        path = Path(path)
+        if not path.exists():
+            raise Exception(f"'{path}' does not exists.")
+
+        with open(path, "rb") as fh:
+            header, offset = _read_binary_header(fh)
 
-        content = json.load(path)
-        return cls(**content)
+        size, dtype = header["size"], np.dtype(header["dtype"])
+        keys = _read_binary_array(path, _KEYS_DTYPE, offset, size, mmap)
+        offset += size * _KEYS_DTYPE.itemsize
+        values = _read_binary_array(path, dtype, offset, size, mmap)
+
+        data = ColumnarStore._from_sorted_arrays(
+            keys, values, tz=header["tz"], shared=mmap
+        )
+        return cls(data, default=header["default"], name=header["name"])
+
+    def to_parquet(self, path, row_group_size=None):
+        """Write to parquet, meta keys being stored in the file metadata.
+
+        Rows are sorted by timestamp, hence statistics of row groups allow
+        :meth:`from_parquet` to skip the ones out of the requested range.
+
+        Args:
+            path (str or Path): file to write to.
+            row_group_size (int): maximum number of points per row group.
+        """
+        if not PYARROW_IMPORTED:
+            raise ImportError(MSG_ERROR_PYARROW)
+
+        keys, values = self._as_arrays()
+        if values.dtype.kind not in NUMERIC_KINDS:
+            values = values.tolist()
+
+        meta = {
+            "default": self.default if self.default != NO_DEFAULT else "no_default",
+            "name": self.name,
+            "tz": str(self.tz),
+        }
+        table = pa.table(
+            {
+                "timestamp": pa.array(keys, type=pa.timestamp("ns", tz=meta["tz"])),
+                "value": pa.array(values),
+            },
+            metadata={PARQUET_METADATA_KEY: json.dumps(meta)},
+        )
+        pq.write_table(table, path, row_group_size=row_group_size)
+
+    @classmethod
+    def from_parquet(cls, path, start=None, end=None, storage=None):
+        """Read a TimeSeries written by :meth:`to_parquet`.
+
+        Only the row groups intersecting [start, end) are read, the result being
+        the same as ``cls.from_parquet(path).slice(start, end)``.
+
+        Args:
+            path (str or Path): file to read from.
+            start (datetime or str): lower bound, optional.
+            end (datetime or str): upper bound, optional.
+            storage (str): storage of the TimeSeries, SortedDict by default.
+
+        Returns:
+            TimeSeries
+        """
+        if not PYARROW_IMPORTED:
+            raise ImportError(MSG_ERROR_PYARROW)
+
+        parquet_file = pq.ParquetFile(path)
+        meta = json.loads(parquet_file.schema_arrow.metadata[PARQUET_METADATA_KEY])
+        tz = meta.pop("tz")
+
+        start = MINTS if start is None else timestamp_converter(start, tz)
+        end = MAXTS if end is None else timestamp_converter(end, tz)
+        # The item on start is kept by slice even when end is not after start
+        row_groups = _select_row_groups(
+            parquet_file.metadata, start.value, max(end.value, start.value + 1)
+        )
+
+        table = parquet_file.read_row_groups(row_groups)
+        keys = table.column("timestamp").cast(pa.int64()).to_numpy()
+        values = to_values_array(table.column("value").to_numpy(zero_copy_only=False))
+
+        ts = cls._from_arrays(
+            keys, values, tz=tz, storage=storage or SORTEDDICT, **meta
+        )
+        if start == MINTS and end == MAXTS:
+            return ts
+        if ts.empty and parquet_file.metadata.num_rows:
+            return ts  # all the keys stored are after the range
+        return ts.slice(start, end)
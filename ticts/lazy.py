@@ -0,0 +1,146 @@
+"""Lazy evaluation of operations on TimeSeries.
+
+Operators on a :class:`LazyTimeSeries` build an expression tree instead of
+computing intermediate TimeSeries. On :meth:`LazyTimeSeries.compute`, the indexes
+of all the TimeSeries involved are merged once and the expression is evaluated
+on whole arrays.
+"""
+
+import logging
+
+import numpy as np
+
+from ticts.operation import (
+    _align_for_operation,
+    _apply_operator,
+    _get_storage_for_operation,
+)
+from ticts.storage import infer_value_dtype
+from ticts.utils import NO_DEFAULT, operation_factory
+
+logger = logging.getLogger(__name__)
+
+
+class LazyTimeSeries:
+    """Expression on TimeSeries, evaluated by :meth:`compute`.
+
+    Built by :meth:`~ticts.timeseries.TimeSeries.lazy`, it supports the same
+    operators as TimeSeries. Any other attribute computes the expression and
+    is read on the resulting TimeSeries.
+
+    Example:
+        >>> ((ts1.lazy() + ts2) * ts3 - ts4.lazy().floor(0)).compute()
+    """
+
+    def __init__(self, ts=None, operator=None, left=None, right=None):
+        self.ts = ts
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        if self.ts is not None:
+            return f"<LazyTimeSeries {self.ts.name}>"
+        return f"<LazyTimeSeries {self.operator.__name__}>"
+
+    def _operate(self, other, operator):
+        if not isinstance(other, LazyTimeSeries) and hasattr(type(other), "lazy"):
+            other = other.lazy()
+        return self.__class__(operator=operator, left=self, right=other)
+
+    def _get_leaves(self):
+        """Return the TimeSeries of the expression, each only once."""
+        if self.ts is not None:
+            return {id(self.ts): self.ts}
+
+        leaves = self.left._get_leaves()
+        if isinstance(self.right, LazyTimeSeries):
+            leaves.update(self.right._get_leaves())
+        return leaves
+
+    def _get_default(self):
+        if self.ts is not None:
+            return self.ts.default if self.ts._has_default else NO_DEFAULT
+
+        left = self.left._get_default()
+        right = self.right
+        if isinstance(right, LazyTimeSeries):
+            right = right._get_default()
+        if left is NO_DEFAULT or right is NO_DEFAULT:
+            return NO_DEFAULT
+
+        try:
+            return self.operator(left, right)
+        except ZeroDivisionError:
+            msg = "Can't compute the resulting default, dividing by 0."
+            logger.warning(msg)
+            return NO_DEFAULT
+
+    def _evaluate(self, all_values, size):
+        if self.ts is not None:
+            return all_values[id(self.ts)]
+
+        left = self.left._evaluate(all_values, size)
+        if isinstance(self.right, LazyTimeSeries):
+            right = self.right._evaluate(all_values, size)
+        else:
+            right = np.full(size, self.right, dtype=infer_value_dtype(self.right))
+        return _apply_operator(self.operator, left, right)
+
+    def compute(self):
+        """Evaluate the expression in one merge of the indexes of all the
+        TimeSeries involved.
+
+        Returns:
+            TimeSeries
+        """
+        leaves = self._get_leaves()
+        all_ts = list(leaves.values())
+        keys, all_values = _align_for_operation(all_ts)
+        all_values = dict(zip(leaves, all_values))
+        values = self._evaluate(all_values, len(keys))
+
+        first = all_ts[0]
+        storage = _get_storage_for_operation(all_ts)
+        return first._from_arrays(
+            keys, values, tz=first.tz, storage=storage, default=self._get_default()
+        )
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.compute(), attr)
+
+    def __getitem__(self, key):
+        return self.compute()[key]
+
+    def __len__(self):
+        return len(self.compute())
+
+    __hash__ = None
+
+    __add__ = operation_factory("__add__")
+    __radd__ = operation_factory("__add__")
+    __sub__ = operation_factory("__sub__")
+
+    __mul__ = operation_factory("__mul__")
+    __truediv__ = operation_factory("__truediv__")
+    __floordiv__ = operation_factory("__floordiv__")
+
+    __lt__ = operation_factory("__lt__")
+    __le__ = operation_factory("__le__")
+    __gt__ = operation_factory("__gt__")
+    __ge__ = operation_factory("__ge__")
+    __eq__ = operation_factory("__eq__")
+
+    __or__ = operation_factory("__or__")
+    __xor__ = operation_factory("__xor__")
+    __and__ = operation_factory("__and__")
+
+    def floor(self, other):
+        """Lazy :meth:`~ticts.timeseries.TimeSeries.floor`."""
+        return self._operate(other, min)
+
+    def ceil(self, other):
+        """Lazy :meth:`~ticts.timeseries.TimeSeries.ceil`."""
+        return self._operate(other, max)
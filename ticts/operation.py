@@ -1,28 +1,147 @@
 import logging
 
+import numpy as np
+
+from ticts.storage import (
+    COLUMNAR,
+    SORTEDDICT,
+    infer_value_dtype,
+    to_datetimeindex,
+    to_values_array,
+)
 from ticts.utils import MINTS, NO_DEFAULT, operation_factory
 
 logger = logging.getLogger(__name__)
 
+# Operators that are not NumPy compatible, mapped to their ufunc counterpart.
+VECTORIZED_OPERATORS = {min: np.minimum, max: np.maximum}
 
-def _get_keys_for_operation(ts1, ts2, *args):
-    all_ts = [ts1, ts2, *args]
+
+def _merge_indexes(*indexes):
+    """Merge sorted int64 epoch nanoseconds arrays into their sorted union.
+
+    The union is obtained by a stable sort of the concatenated runs, which is a
+    k-way merge of them.
+
+    Returns:
+        tuple of the union and, for each index, the positions of its keys in it.
+    """
+    concatenated = np.concatenate(indexes)
+    order = np.argsort(concatenated, kind="stable")
+    merged = concatenated[order]
+
+    is_new = np.ones(len(merged), dtype=bool)
+    is_new[1:] = merged[1:] != merged[:-1]
+
+    ranks = np.empty(len(merged), dtype=np.int64)
+    ranks[order] = np.cumsum(is_new) - 1
+    splits = np.cumsum([len(index) for index in indexes])[:-1]
+
+    return merged[is_new], np.split(ranks, splits)
+
+
+def _forward_fill_positions(ranks, size):
+    """Return for each key of the union the position of the last key of the index
+    lower or equal to it (-1 if none), from the positions of the index in it."""
+    positions = np.full(size, -1, dtype=np.int64)
+    positions[ranks] = np.arange(len(ranks))
+    return np.maximum.accumulate(positions)
+
+
+def _check_all_timeseries(all_ts):
     for ts in all_ts:
         if not ts.__class__.__name__ == "TimeSeries":
             raise TypeError(f"{ts} is not of type TimeSeries")
 
-    all_keys = set.union(*[set(ts.index) for ts in all_ts])
 
+def _get_lower_bound_for_operation(all_ts):
     lower_bound = MINTS
     for ts in all_ts:
         if not ts._has_default:
             lower_bound = max(lower_bound, ts.lower_bound)
+    return lower_bound
+
+
+def _get_default_for_operation(operator, all_ts):
+    if not all(ts._has_default for ts in all_ts):
+        return NO_DEFAULT
+
+    default = all_ts[0].default
+    for ts in all_ts[1:]:
+        try:
+            default = operator(default, ts.default)
+        except ZeroDivisionError:
+            msg = (
+                "The TimeSeries has 0. as default value."
+                " Can't compute the resulting default."
+            )
+            logger.warning(msg)
+            return NO_DEFAULT
+    return default
+
+
+def _get_storage_for_operation(all_ts):
+    if any(ts.storage == COLUMNAR for ts in all_ts):
+        return COLUMNAR
+    return SORTEDDICT
+
+
+def _align_for_operation(all_ts):
+    """Return the sorted keys on which an operation is defined, as int64 epoch
+    nanoseconds, and an iterator over the forward-filled values of each
+    TimeSeries on them (computed lazily, one TimeSeries at a time)."""
+    all_arrays = [ts._as_arrays() for ts in all_ts]
+    keys, all_ranks = _merge_indexes(*[index for index, _ in all_arrays])
+
+    lower_bound = _get_lower_bound_for_operation(all_ts)
+    start = np.searchsorted(keys, lower_bound.value)
+
+    def iter_values():
+        for ts, (_, values), ranks in zip(all_ts, all_arrays, all_ranks):
+            positions = _forward_fill_positions(ranks, len(keys))[start:]
+            if ts.empty:
+                # bool is promoted to the dtype of whatever value fills it
+                values = np.empty(len(positions), dtype=bool)
+            else:
+                values = values[np.maximum(positions, 0)]
+            yield ts._fill_out_of_left_bound(values, positions < 0, keys[start:])
+
+    return keys[start:], iter_values()
 
-    return [key for key in all_keys if key >= lower_bound]
+
+def _get_keys_for_operation(ts1, ts2, *args):
+    all_ts = [ts1, ts2, *args]
+    _check_all_timeseries(all_ts)
+
+    keys, _ = _merge_indexes(*[ts._as_arrays()[0] for ts in all_ts])
+    lower_bound = _get_lower_bound_for_operation(all_ts)
+    keys = keys[np.searchsorted(keys, lower_bound.value) :]
+
+    return list(to_datetimeindex(keys, ts1.tz))
+
+
+def _apply_operator(operator, left, right):
+    """Apply operator element-wise, vectorized if both sides are numeric."""
+    if left.dtype.kind in "iuf" and right.dtype.kind in "iuf":
+        fn = VECTORIZED_OPERATORS.get(operator, operator)
+        try:
+            with np.errstate(divide="raise", invalid="raise"):
+                result = fn(left, right)
+        except (ArithmeticError, TypeError, ValueError):
+            # Let the element-wise application raise (or not) as usual
+            result = None
+
+        if isinstance(result, np.ndarray) and result.shape == left.shape:
+            return result
+
+    values = [operator(a, b) for a, b in zip(left.tolist(), right.tolist())]
+    return to_values_array(values)
 
 
 class TictsOperationMixin:
     def _operate(self, other, operator):
+        if other.__class__.__name__ == "LazyTimeSeries":
+            return self.lazy()._operate(other, operator)
         if isinstance(other, self.__class__):
             return self._operate_on_ts(other, operator)
         else:
@@ -32,27 +151,16 @@ class TictsOperationMixin:
         if not isinstance(other, self.__class__):
             raise TypeError
 
-        all_keys = set(self.index).union(set(other.index))
-
-        default = NO_DEFAULT
-        if self._has_default and other._has_default:
-            try:
-                default = operator(self.default, other.default)
-            except ZeroDivisionError:
-                default = NO_DEFAULT
-                msg = (
-                    "The TimeSeries has 0. as default value."
-                    " Can't compute the resulting default."
-                )
-                logger.warning(msg)
-
-        all_keys = _get_keys_for_operation(self, other)
+        all_ts = [self, other]
+        default = _get_default_for_operation(operator, all_ts)
 
-        ts = self.__class__(default=default)
-        for key in all_keys:
-            ts[key] = operator(self[key], other[key])
+        keys, (values, other_values) = _align_for_operation(all_ts)
+        values = _apply_operator(operator, values, other_values)
 
-        return ts
+        storage = _get_storage_for_operation(all_ts)
+        return self._from_arrays(
+            keys, values, tz=self.tz, storage=storage, default=default
+        )
 
     def _operate_on_scalar(self, value, operator):
         sample_value = self.values()[0] if not self.empty else self.default
@@ -72,11 +180,14 @@ class TictsOperationMixin:
         if self._has_default:
             default = operator(self.default, value)
 
-        ts = self.__class__(default=default)
-        for key in self.index:
-            ts[key] = operator(self[key], value)
+        keys, values = self._as_arrays()
+        scalars = np.empty(len(values), dtype=infer_value_dtype(value))
+        scalars.fill(value)
+        values = _apply_operator(operator, values, scalars)
 
-        return ts
+        return self._from_arrays(
+            keys, values, tz=self.tz, storage=self.storage, default=default
+        )
 
     __add__ = operation_factory("__add__")
     __radd__ = operation_factory("__add__")
@@ -1,12 +1,43 @@
+import numpy as np
 import pandas as pd
 from pandas.tseries.frequencies import infer_freq, to_offset
+from pandas.tseries.offsets import Tick
 
-from ticts.utils import timestamp_converter
+from ticts.storage import COLUMNAR, to_datetimeindex
+from ticts.utils import timestamp_converter, timestamps_converter
+
+
+def _get_sampling_grid(start, end, freq):
+    """Return the keys start, start + freq, ... lower than end as int64 epoch
+    nanoseconds."""
+    if start >= end:
+        return np.empty(0, dtype=np.int64)
+
+    if isinstance(freq, Tick):  # fixed frequency
+        count = -(-(end.value - start.value) // freq.nanos)
+        return start.value + freq.nanos * np.arange(count, dtype=np.int64)
+
+    # Non fixed frequencies (e.g. month starts) can't be computed by arithmetic,
+    # and pd.date_range would roll start and end on the offset.
+    keys = []
+    dt = start
+    while dt < end:
+        keys.append(dt.value)
+        dt = dt + freq
+    return np.array(keys, dtype=np.int64)
 
 
 class PandasMixin:
     def to_series(self) -> pd.Series:
-        series = pd.Series(data=self.values(), index=self.index, name=self.name)
+        if self.storage == COLUMNAR:
+            # Built from the arrays rather than item by item through the views
+            series = pd.Series(
+                data=self.data.array_values.copy(),
+                index=to_datetimeindex(self.data.int_keys, self.tz),
+                name=self.name,
+            )
+        else:
+            series = pd.Series(data=self.values(), index=self.index, name=self.name)
 
         # Need at least 3 dates to infer frequency
         if len(series.index) >= 3:
@@ -27,6 +58,8 @@ class PandasMixin:
                 :meth:`~timeseries.TimeSeries.lower_bound`.
             end (datetime): right bound. Default to None, which result into
                 :meth:`~timeseries.TimeSeries.upper_bound`.
+            index (array-like): datetimes to sample on instead of a frequency.
+            interpolate (str): interpolate operator among ["previous", "linear"].
 
         Returns:
             evenly-spaced timeseries.
@@ -49,9 +82,8 @@ class PandasMixin:
             return ts
 
         if index is not None:
-            for idx in index:
-                ts[idx] = self[idx]
-            return ts
+            keys = np.unique(timestamps_converter(index, self.tz))
+            return self._sample_on(keys, interpolate)
 
         if start:
             start = timestamp_converter(start)
@@ -65,9 +97,11 @@ class PandasMixin:
         else:
             end = self.upper_bound + freq
 
-        dt = start
-        while dt < end:
-            ts[dt] = self[dt, interpolate]
-            dt = dt + freq
+        keys = _get_sampling_grid(start, end, freq)
+        return self._sample_on(keys, interpolate)
 
-        return ts
+    def _sample_on(self, keys, interpolate):
+        values = self._at(keys, interpolate.lower())
+        return self._from_arrays(
+            keys, values, tz=self.tz, storage=self.storage, default=self.default
+        )
@@ -0,0 +1,64 @@
+"""Parallel execution of a function on many independent TimeSeries.
+
+TimeSeries are pickled as keys and values arrays (see
+:meth:`~ticts.timeseries.TictsMagicMixin.__reduce__`), which keeps shipping them
+to and from worker processes cheap.
+"""
+
+import builtins
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def _apply_on_chunk(func, chunk):
+    return [func(ts) for ts in chunk]
+
+
+def _iter_chunks(iterable, chunksize):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def map(func, series, workers=None, chunksize=1, prefetch=2):
+    """Apply func on each TimeSeries in a pool of processes, as the builtin map.
+
+    Results are yielded in the order of series, while at most
+    ``workers * prefetch`` chunks are in flight: series is consumed lazily, so
+    memory stays bounded whatever its length.
+
+    Example:
+        >>> for ts in ticts.parallel.map(pipeline, all_ts, workers=32):
+        ...     ts.to_json(...)
+
+    Args:
+        func (callable): picklable function (e.g. defined at a module level)
+            taking a TimeSeries.
+        series (iterable of TimeSeries): series to apply func on.
+        workers (int): number of processes, default to the number of CPUs.
+            With 1, func is applied in the current process.
+        chunksize (int): number of series sent to a process at once, higher
+            values lowering the overhead for small series.
+        prefetch (int): number of chunks in flight per process.
+
+    Returns:
+        iterator of the results of func.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from builtins.map(func, series)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for chunk in _iter_chunks(series, chunksize):
+            pending.append(executor.submit(_apply_on_chunk, func, chunk))
+            if len(pending) >= workers * prefetch:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
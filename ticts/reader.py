@@ -0,0 +1,121 @@
+"""Sequential reads of a TimeSeries.
+
+A :class:`TimeSeriesReader` remembers the position of its last lookup and
+resolves the next one by an exponential (finger) search from it: reading k
+increasing keys costs O(k log d), d being the number of measurements between
+consecutive keys, instead of O(k log n).
+"""
+
+from bisect import bisect_right
+
+import pandas as pd
+
+from ticts.utils import NO_DEFAULT, timestamp_converter
+
+
+class TimeSeriesReader:
+    """Cursor over a snapshot of a TimeSeries, getting values as
+    :meth:`~ticts.timeseries.TimeSeries.__getitem__` does.
+
+    Built by :meth:`~ticts.timeseries.TimeSeries.reader`. Lookups walking
+    forward in time start from the last position, backward jumps fall back on
+    a bisection. Changes made to the TimeSeries afterwards are not seen.
+
+    Example:
+        >>> reader = ts.reader()
+        >>> [reader[key] for key in increasing_keys]
+    """
+
+    def __init__(self, ts, interpolate=None):
+        self.interpolate = (interpolate or ts._default_interpolate).lower()
+
+        self.tz = ts.tz
+        self.default = ts.default
+        self.permissive = ts.permissive
+
+        keys, values = ts._as_arrays()
+        self._keys = keys.tolist()
+        self._values = values.tolist()
+        self._position = 0
+
+    def __repr__(self):
+        return f"<TimeSeriesReader interpolate={self.interpolate} size={len(self)}>"
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _to_int(self, key):
+        if isinstance(key, pd.Timestamp) and key.tz is not None:
+            return key.value
+        return timestamp_converter(key, self.tz).value
+
+    def _seek(self, key):
+        """Return the position of the last measurement lower or equal to key,
+        -1 if none."""
+        keys = self._keys
+        if not keys:
+            return -1
+
+        lo = self._position
+        if key < keys[lo]:  # backward jump
+            position = bisect_right(keys, key, 0, lo) - 1
+            self._position = max(position, 0)
+            return position
+
+        # Gallop forward until overtaking key, then bisect the last step
+        step, hi = 1, lo + 1
+        while hi < len(keys) and keys[hi] <= key:
+            lo = hi
+            hi += step
+            step *= 2
+        position = bisect_right(keys, key, lo, min(hi, len(keys))) - 1
+        self._position = position
+        return position
+
+    def _get_out_of_left_bound(self, key):
+        if self.default is not NO_DEFAULT:
+            return self.default
+        if self.permissive:
+            return None
+        msg = (
+            "Getting {} but default attribute is not set, "
+            "can't deduce value before the oldest measurement"
+        )
+        raise KeyError(msg.format(pd.Timestamp(key, tz="UTC").tz_convert(self.tz)))
+
+    def get(self, key, interpolate=None):
+        """Get the value on key.
+
+        Args:
+            key (datetime): datetime index
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the interpolation of the
+                reader.
+        """
+        interpolate = (interpolate or self.interpolate).lower()
+        if interpolate not in ("previous", "linear"):
+            raise ValueError(f"'{interpolate}' interpolation unknown.")
+
+        key = self._to_int(key)
+        position = self._seek(key)
+        if position < 0:
+            return self._get_out_of_left_bound(key)
+
+        previous_key = self._keys[position]
+        previous_value = self._values[position]
+        if (
+            interpolate == "previous"
+            or previous_key == key
+            or position + 1 == len(self._keys)
+        ):
+            return previous_value
+
+        next_key = self._keys[position + 1]
+        next_value = self._values[position + 1]
+        coeff = (key - previous_key) / (next_key - previous_key)
+        return previous_value + coeff * (next_value - previous_value)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.get(*key)
+        return self.get(key)
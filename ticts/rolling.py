@@ -0,0 +1,155 @@
+"""Rolling time-window operators, evaluated at the keys of a TimeSeries.
+
+The window of a key t is [t - window, t], values weighting as much as the
+duration they hold for in it, according to the interpolation.
+"""
+
+import operator
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from ticts.storage import NUMERIC_KINDS
+from ticts.utils import NO_DEFAULT
+
+
+def _rolling_extremum(values, starts, is_better):
+    """Return the extremum of ``values[starts[k]:k + 1]`` for each k.
+
+    A monotonic deque of positions is kept along the keys, each position being
+    pushed and popped once at most: O(n) overall, starts being non-decreasing.
+    """
+    values = values.tolist()
+    window = deque()
+    result = []
+    for k, (value, start) in enumerate(zip(values, starts.tolist())):
+        while window and not is_better(values[window[-1]], value):
+            window.pop()
+        window.append(k)
+        while window[0] < start:
+            window.popleft()
+        result.append(values[window[0]])
+    return np.array(result, dtype=np.float64)
+
+
+class Rolling:
+    """Rolling time-window view of a TimeSeries, see
+    :meth:`~ticts.timeseries.TimeSeries.rolling`."""
+
+    def __init__(self, ts, window, interpolate=None):
+        self.ts = ts
+        self.window = pd.Timedelta(window)
+        if self.window <= pd.Timedelta(0):
+            raise ValueError(f"window should be positive, got {window}.")
+        self.interpolate = (interpolate or ts._default_interpolate).lower()
+
+        self.keys, values = ts._as_arrays()
+        if values.dtype.kind not in NUMERIC_KINDS:
+            raise TypeError("Rolling operators require numeric values.")
+        self.values = values.astype(np.float64)
+
+        # Left edges of the windows, the last key before them and their values
+        self.edges = self.keys - self.window.value
+        self.previous = np.searchsorted(self.keys, self.edges, side="right") - 1
+        self.edge_values, self.missing = ts._lookup(self.edges, self.interpolate)
+        self.edge_values = self.edge_values.astype(np.float64)
+        if ts._has_default:
+            self.edge_values[self.missing] = ts.default
+            self.missing[:] = False
+
+    def __repr__(self):
+        return f"<Rolling window={self.window} interpolate={self.interpolate}>"
+
+    def _build(self, values, default=NO_DEFAULT):
+        ts = self.ts
+        return ts._from_arrays(
+            self.keys, values, tz=ts.tz, storage=ts.storage, default=default
+        )
+
+    def _get_cumulative_integral(self):
+        """Return the integral from the first key to each key, in nanoseconds."""
+        durations = np.diff(self.keys).astype(np.float64)
+        left, right = self.values[:-1], self.values[1:]
+        if self.interpolate == "previous":
+            areas = left * durations
+        else:
+            areas = (left + right) / 2 * durations
+        return np.concatenate(([0.0], np.cumsum(areas)))
+
+    def _get_integrals(self):
+        """Return the integrals on the windows, in nanoseconds, and the duration
+        of the windows (shorter when starting before the lower bound without
+        default)."""
+        if not len(self.keys):
+            return np.empty(0), np.empty(0)
+        cumulative = self._get_cumulative_integral()
+
+        # Integral from the first key to the left edges
+        previous = np.maximum(self.previous, 0)
+        elapsed = (self.edges - self.keys[previous]).astype(np.float64)
+        if self.interpolate == "previous":
+            partial = self.values[previous] * elapsed
+        else:
+            partial = (self.values[previous] + self.edge_values) / 2 * elapsed
+        at_edges = cumulative[previous] + partial
+
+        # Before the first key, the default holds (if any)
+        before = self.previous < 0
+        at_edges[before] = np.where(
+            self.missing[before], 0.0, -self.edge_values[before]
+        )
+        at_edges[before] *= (self.keys[0] - self.edges[before]).astype(np.float64)
+
+        durations = np.full(len(self.keys), float(self.window.value))
+        durations[self.missing] = (self.keys - self.keys[0])[self.missing]
+        return cumulative - at_edges, durations
+
+    def integral(self, unit="s"):
+        """Rolling integral.
+
+        Args:
+            unit (str): time unit of the integral, e.g. "s" or "h".
+
+        Returns:
+            TimeSeries
+        """
+        integrals, _ = self._get_integrals()
+        return self._build(integrals / pd.Timedelta(1, unit=unit).value)
+
+    def mean(self):
+        """Rolling time-weighted mean, the value on the key if the window is
+        empty.
+
+        Returns:
+            TimeSeries
+        """
+        integrals, durations = self._get_integrals()
+        means = np.divide(
+            integrals, durations, out=self.values.copy(), where=durations > 0
+        )
+        return self._build(means, default=self.ts.default)
+
+    def _extremum(self, is_better, ufunc):
+        extrema = _rolling_extremum(self.values, self.previous + 1, is_better)
+        # The value on the left edge, which holds from it, is part of the window
+        extrema[~self.missing] = ufunc(
+            extrema[~self.missing], self.edge_values[~self.missing]
+        )
+        return self._build(extrema, default=self.ts.default)
+
+    def min(self):  # A003
+        """Rolling minimum.
+
+        Returns:
+            TimeSeries
+        """
+        return self._extremum(operator.lt, np.minimum)
+
+    def max(self):  # A003
+        """Rolling maximum.
+
+        Returns:
+            TimeSeries
+        """
+        return self._extremum(operator.gt, np.maximum)
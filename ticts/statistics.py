@@ -0,0 +1,313 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
+
+from ticts.operation import _merge_indexes
+from ticts.pandas_mixin import _get_sampling_grid
+from ticts.rolling import Rolling
+from ticts.storage import NUMERIC_KINDS
+from ticts.utils import NO_DEFAULT, timestamp_converter
+
+RESAMPLING_AGGREGATIONS = ("mean", "min", "max", "integral", "last", "count")
+
+
+def _get_segments_bounds(keys, values, interpolate, lower_bound):
+    """Return the values on the left and on the right of each segment between
+    consecutive keys, the default holding until the lower bound whatever the
+    interpolation."""
+    left, right = values[:-1], values[1:]
+    if interpolate == "linear":
+        right = np.where(keys[:-1] < lower_bound, left, right)
+    return left, right
+
+
+def _get_moments(keys, values, interpolate, lower_bound):
+    """Return the duration (in nanoseconds), the integral and the integral of the
+    square of a TimeSeries, being constant ("previous") or linear ("linear")
+    between consecutive keys."""
+    durations = np.diff(keys).astype(np.float64)
+    left, right = _get_segments_bounds(keys, values, interpolate, lower_bound)
+
+    if interpolate == "previous":
+        integral = left @ durations
+        integral_of_square = (left * left) @ durations
+    else:
+        integral = (left + right) / 2 @ durations
+        integral_of_square = (
+            (left * left + left * right + right * right) / 3 @ durations
+        )
+
+    return durations.sum(), integral, integral_of_square
+
+
+def _get_reached_values(keys, values, interpolate):
+    """Values reached on [start, end), the last one being the value on end."""
+    if interpolate == "previous" and keys[0] < keys[-1]:
+        return values[:-1]
+    return values
+
+
+def _get_resampling_edges(start, end, freq, truncate=True):
+    """Return the edges of the buckets [start, start + freq), ... covering up to
+    end, the last bucket being truncated on end if truncate."""
+    edges = _get_sampling_grid(start, end, freq)
+    last_edge = (pd.Timestamp(edges[-1], tz=start.tz) + freq).value
+    if truncate:
+        last_edge = min(last_edge, end.value)
+    return np.append(edges, last_edge)
+
+
+class TictsStatisticsMixin:
+    """Time-weighted statistics, each value weighting as much as the duration it
+    holds for, according to the interpolation."""
+
+    def _get_segments(self, start, end, interpolate):
+        """Return the keys on [start, end] as int64 epoch nanoseconds, start and
+        end included, and the float values on them."""
+        interpolate = (interpolate or self._default_interpolate).lower()
+        start = (
+            self.lower_bound if start is None else timestamp_converter(start, self.tz)
+        )
+        end = self.upper_bound if end is None else timestamp_converter(end, self.tz)
+        if start > end:
+            msg = "start should be lower than end, got {} > {}."
+            raise ValueError(msg.format(start, end))
+
+        index, _ = self._as_arrays()
+        lo = np.searchsorted(index, start.value, side="right")
+        hi = max(lo, np.searchsorted(index, end.value, side="left"))
+        keys = np.concatenate(([start.value], index[lo:hi], [end.value]))
+
+        values = self._at(keys, interpolate)
+        if values.dtype.kind not in NUMERIC_KINDS:
+            msg = (
+                "Can't compute statistics on non-numeric values from {} to {},"
+                " a default might be missing."
+            )
+            raise TypeError(msg.format(start, end))
+
+        return keys, values.astype(np.float64), interpolate
+
+    def integral(self, start=None, end=None, interpolate=None, unit="s"):
+        """Area under the TimeSeries from start to end.
+
+        Args:
+            start (datetime or str): lower bound, default to lower_bound.
+            end (datetime or str): upper bound, default to upper_bound.
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the default interpolation.
+            unit (str): time unit of the integral, e.g. "s" or "h".
+
+        Returns:
+            float
+        """
+        keys, values, interpolate = self._get_segments(start, end, interpolate)
+        _, integral, _ = _get_moments(keys, values, interpolate, self.lower_bound.value)
+        return integral / pd.Timedelta(1, unit=unit).value
+
+    def mean(self, start=None, end=None, interpolate=None):
+        """Time-weighted mean of the TimeSeries from start to end.
+
+        Args:
+            start (datetime or str): lower bound, default to lower_bound.
+            end (datetime or str): upper bound, default to upper_bound.
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the default interpolation.
+
+        Returns:
+            float, the value on start if start equals end.
+        """
+        keys, values, interpolate = self._get_segments(start, end, interpolate)
+        duration, integral, _ = _get_moments(
+            keys, values, interpolate, self.lower_bound.value
+        )
+        if not duration:
+            return values[0]
+        return integral / duration
+
+    def min(self, start=None, end=None, interpolate=None):  # A003
+        """Minimum of the TimeSeries from start to end.
+
+        Args:
+            start (datetime or str): lower bound, default to lower_bound.
+            end (datetime or str): upper bound, default to upper_bound.
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the default interpolation.
+
+        Returns:
+            float
+        """
+        keys, values, interpolate = self._get_segments(start, end, interpolate)
+        return _get_reached_values(keys, values, interpolate).min()
+
+    def max(self, start=None, end=None, interpolate=None):  # A003
+        """Maximum of the TimeSeries from start to end.
+
+        Args:
+            start (datetime or str): lower bound, default to lower_bound.
+            end (datetime or str): upper bound, default to upper_bound.
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the default interpolation.
+
+        Returns:
+            float
+        """
+        keys, values, interpolate = self._get_segments(start, end, interpolate)
+        return _get_reached_values(keys, values, interpolate).max()
+
+    def describe(self, start=None, end=None, interpolate=None):
+        """Time-weighted statistics of the TimeSeries from start to end.
+
+        Args:
+            start (datetime or str): lower bound, default to lower_bound.
+            end (datetime or str): upper bound, default to upper_bound.
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the default interpolation.
+
+        Returns:
+            pd.Series with the number of measurements, the duration, the mean,
+            the standard deviation, the minimum and the maximum.
+        """
+        keys, values, interpolate = self._get_segments(start, end, interpolate)
+        duration, integral, integral_of_square = _get_moments(
+            keys, values, interpolate, self.lower_bound.value
+        )
+
+        if duration:
+            mean = integral / duration
+            std = np.sqrt(max(integral_of_square / duration - mean * mean, 0.0))
+        else:
+            mean, std = values[0], 0.0
+
+        start, end = (pd.Timestamp(key, tz="UTC") for key in (keys[0], keys[-1]))
+        count = self.data.bisect_left(end) - self.data.bisect_left(start)
+        reached_values = _get_reached_values(keys, values, interpolate)
+
+        return pd.Series(
+            {
+                "count": int(count),
+                "duration": pd.Timedelta(int(duration)),
+                "mean": mean,
+                "std": std,
+                "min": reached_values.min(),
+                "max": reached_values.max(),
+            },
+            name=self.name,
+        )
+
+    def rolling(self, window, interpolate=None):
+        """Rolling time-window operators, evaluated at each key t on the window
+        [t - window, t].
+
+        Example:
+            >>> ts.rolling("15min").mean()
+
+        Args:
+            window (timedelta or str): length of the window.
+            interpolate (str): interpolate operator among ["previous", "linear"].
+
+        Returns:
+            Rolling, with mean, min, max and integral methods returning
+            TimeSeries.
+        """
+        return Rolling(self, window, interpolate)
+
+    def resample(
+        self, freq, agg="mean", start=None, end=None, interpolate=None, unit="s"
+    ):
+        """Aggregate the TimeSeries on buckets of time, time-weighted.
+
+        Contrary to :meth:`sample`, which takes the value on each instant, the
+        aggregates are computed exactly from all the values of the buckets.
+
+        Args:
+            freq (timedelta or str): length of the buckets.
+            agg (str): aggregation among ["mean", "min", "max", "integral",
+                "last", "count"]. "last" is the value at the end of the bucket
+                and "count" the number of measurements in it.
+            start (datetime or str): left bound. Default to None, which result
+                into the lower bound floored on freq.
+            end (datetime or str): right bound. Default to None, which result
+                into the end of the bucket of the upper bound.
+            interpolate (str): interpolate operator among ["previous", "linear"].
+            unit (str): time unit of the "integral" aggregation.
+
+        Returns:
+            TimeSeries whose keys are the starts of the buckets.
+        """
+        if agg not in RESAMPLING_AGGREGATIONS:
+            msg = "'{}' aggregation unknown, should be one of {}."
+            raise ValueError(msg.format(agg, RESAMPLING_AGGREGATIONS))
+
+        interpolate = (interpolate or self._default_interpolate).lower()
+        freq = to_offset(freq)
+        default = self.default if agg in ("mean", "min", "max", "last") else NO_DEFAULT
+        if self.empty:
+            return self.__class__(default=default)
+
+        if start is None:
+            start = self.lower_bound
+            start = (
+                start.floor(freq)
+                if isinstance(freq, Tick)
+                else freq.rollback(start.normalize())
+            )
+        else:
+            start = timestamp_converter(start, self.tz)
+        truncate = end is not None
+        if end is None:
+            end = self.upper_bound + pd.Timedelta(1)
+        else:
+            end = timestamp_converter(end, self.tz)
+
+        if start >= end:
+            return self.__class__(default=default)
+        edges = _get_resampling_edges(start, end, freq, truncate)
+        grid = edges[:-1].copy()
+
+        index, _ = self._as_arrays()
+        if agg == "count":
+            values = np.diff(np.searchsorted(index, edges))
+            return self._from_arrays(grid, values, tz=self.tz, storage=self.storage)
+
+        # Without default, buckets only start from the one of the lower bound.
+        if not self._has_default:
+            first = max(np.searchsorted(edges, index[0], side="right") - 1, 0)
+            grid, edges = grid[first:], edges[first:]
+            if not len(grid):
+                return self.__class__(default=default)
+            edges[0] = max(edges[0], index[0])
+
+        inner = index[(index > edges[0]) & (index < edges[-1])]
+        points, _ = _merge_indexes(edges, inner)
+        values = self._at(points, interpolate)
+        if values.dtype.kind not in NUMERIC_KINDS:
+            msg = "Can't aggregate non-numeric values with '{}'."
+            raise TypeError(msg.format(agg))
+        values = values.astype(np.float64)
+
+        left, right = _get_segments_bounds(points, values, interpolate, index[0])
+        starts = np.searchsorted(points, edges[:-1])
+        if agg in ("mean", "integral"):
+            if interpolate == "previous":
+                areas = left * np.diff(points)
+            else:
+                areas = (left + right) / 2 * np.diff(points)
+            result = np.add.reduceat(areas, starts)
+            if agg == "mean":
+                result = result / np.diff(edges)
+            else:
+                result = result / pd.Timedelta(1, unit=unit).value
+        elif agg in ("min", "max"):
+            ufunc = np.minimum if agg == "min" else np.maximum
+            result = ufunc.reduceat(left, starts)
+            if interpolate == "linear":
+                result = ufunc(result, ufunc.reduceat(right, starts))
+        else:  # last
+            ends = np.append(starts[1:], len(left)) - 1
+            result = left[ends] if interpolate == "previous" else right[ends]
+
+        return self._from_arrays(
+            grid, result, tz=self.tz, storage=self.storage, default=default
+        )
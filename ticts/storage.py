@@ -0,0 +1,455 @@
+from collections.abc import ItemsView, KeysView, MutableMapping, Sequence, ValuesView
+
+import numpy as np
+import pandas as pd
+
+from ticts.utils import timestamp_converter
+
+SORTEDDICT = "sorteddict"
+COLUMNAR = "columnar"
+
+AVAILABLE_STORAGES = (SORTEDDICT, COLUMNAR)
+
+# Value kinds the columnar store keeps in a typed array: bool, int, uint, float.
+NUMERIC_KINDS = "biuf"
+
+_MIN_CAPACITY = 16
+
+
+def infer_value_dtype(value):
+    """Return the NumPy dtype used to store value."""
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype(bool)
+    if isinstance(value, (int, np.integer)):
+        return np.dtype(np.int64)
+    if isinstance(value, (float, np.floating)):
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def promote_value_types(dtype, other):
+    """Return the NumPy dtype storing values of both dtypes, booleans mixed
+    with other numbers being kept as objects rather than converted."""
+    dtype, other = np.dtype(dtype), np.dtype(other)
+    if (dtype.kind == "b") != (other.kind == "b"):
+        return np.dtype(object)
+    return np.promote_types(dtype, other)
+
+
+def _to_python(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def to_datetimeindex(keys, tz):
+    """Convert an int64 array of epoch nanoseconds into a tz-aware DatetimeIndex."""
+    return pd.DatetimeIndex(keys.view("M8[ns]")).tz_localize("UTC").tz_convert(tz)
+
+
+def to_values_array(values):
+    """Convert a sequence of values into a 1-dimensional NumPy array."""
+    try:
+        array = np.asarray(values)
+    except ValueError:  # e.g. values being sequences of different lengths
+        array = None
+    # e.g. values being sequences themselves, or mixing types NumPy would
+    # convert into strings, or booleans with numbers
+    if (
+        array is None
+        or array.ndim != 1
+        or array.dtype.kind not in NUMERIC_KINDS
+        or (array is not values and _mixes_bools(values, array.dtype))
+    ):
+        array = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            array[i] = value
+    return array
+
+
+def _mixes_bools(values, dtype):
+    if dtype.kind not in "iuf":
+        return False
+    types = set(map(type, values))
+    return bool in types or np.bool_ in types
+
+
+class ColumnarKeysView(KeysView, Sequence):
+    def __getitem__(self, index):
+        return self._mapping._key_at(index)
+
+    def __delitem__(self, index):
+        self._mapping._delete_at(index)
+
+    def __reversed__(self):
+        return reversed(self._mapping._key_at(slice(None)))
+
+
+class ColumnarValuesView(ValuesView, Sequence):
+    def __getitem__(self, index):
+        return self._mapping._value_at(index)
+
+    def __iter__(self):
+        return iter(self._mapping._value_at(slice(None)))
+
+
+class ColumnarItemsView(ItemsView, Sequence):
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            keys = self._mapping._key_at(index)
+            values = self._mapping._value_at(index)
+            return list(zip(keys, values))
+        return self._mapping.peekitem(index)
+
+    def __iter__(self):
+        return zip(
+            self._mapping._key_at(slice(None)), self._mapping._value_at(slice(None))
+        )
+
+
+def _sort_unique(keys, values):
+    """Sort keys and values by keys, keeping the last value of duplicated keys,
+    as a dict would."""
+    if len(keys) > 1 and not (keys[1:] > keys[:-1]).all():
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        values = values[order]
+        is_last = np.append(keys[1:] != keys[:-1], True)
+        keys = keys[is_last]
+        values = values[is_last]
+    return keys, values
+
+
+class ColumnarStore(MutableMapping):
+    """Sorted mapping of timestamps to numeric values backed by NumPy arrays.
+
+    Keys are stored as int64 nanoseconds since epoch (UTC) and values in a typed
+    array, both with amortized append capacity. It mimics the subset of the
+    :class:`sortedcontainers.SortedDict` interface used by
+    :class:`~ticts.timeseries.TimeSeries`, returning tz-aware timestamps in ``tz``.
+
+    Args:
+        keys (array-like of int): epoch nanoseconds, need not be sorted.
+        values (array-like): values aligned with ``keys``. On duplicated keys,
+            the last value wins.
+        tz: timezone of the timestamps returned.
+    """
+
+    def __init__(self, keys=None, values=None, tz="UTC"):
+        self.tz = tz
+
+        if keys is None:
+            keys = np.empty(0, dtype=np.int64)
+            values = np.empty(0, dtype=np.float64)
+
+        keys = np.asarray(keys, dtype=np.int64)
+        values = np.asarray(values)
+        if len(keys) != len(values):
+            msg = "keys and values should have the same length: {} != {}."
+            raise ValueError(msg.format(len(keys), len(values)))
+
+        keys, values = _sort_unique(keys, values)
+
+        self._keys = np.array(keys, dtype=np.int64)
+        self._values = np.array(values)
+        self._size = len(keys)
+        # Whether the arrays are shared with another store (see range_view).
+        self._shared = False
+
+    @classmethod
+    def _from_sorted_arrays(cls, keys, values, tz, shared=False):
+        store = cls.__new__(cls)
+        store.tz = tz
+        store._keys = keys
+        store._values = values
+        store._size = len(keys)
+        store._shared = shared
+        return store
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    @property
+    def int_keys(self):
+        """Return the keys as an int64 array of epoch nanoseconds (no copy)."""
+        return self._keys[: self._size]
+
+    @property
+    def array_values(self):
+        """Return the values as a NumPy array (no copy)."""
+        return self._values[: self._size]
+
+    @property
+    def nbytes(self):
+        return self._keys.nbytes + self._values.nbytes
+
+    # Internals
+
+    def _to_int(self, key):
+        if not isinstance(key, pd.Timestamp):
+            key = timestamp_converter(key, self.tz)
+        return key.value
+
+    def _locate(self, key):
+        ikey = self._to_int(key)
+        pos = int(np.searchsorted(self.int_keys, ikey))
+        found = pos < self._size and self._keys[pos] == ikey
+        return ikey, pos, found
+
+    def _key_at(self, index):
+        if isinstance(index, slice):
+            return list(to_datetimeindex(self.int_keys[index], self.tz))
+        return pd.Timestamp(int(self.int_keys[index]), tz=self.tz)
+
+    def _value_at(self, index):
+        if isinstance(index, slice):
+            return self.array_values[index].tolist()
+        return _to_python(self.array_values[index])
+
+    def _materialize(self):
+        """Copy the arrays if shared, before mutating them."""
+        if self._shared:
+            self._keys = self.int_keys.copy()
+            self._values = self.array_values.copy()
+            self._shared = False
+
+    def _reserve(self, size):
+        capacity = len(self._keys)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, _MIN_CAPACITY)
+
+        keys = np.empty(capacity, dtype=np.int64)
+        keys[: self._size] = self.int_keys
+        values = np.empty(capacity, dtype=self.dtype)
+        values[: self._size] = self.array_values
+
+        self._keys, self._values = keys, values
+
+    def _prepare_value(self, value):
+        dtype = infer_value_dtype(value)
+        if self._size == 0:
+            # An empty store adopts the type of its first value.
+            self._values = np.empty(len(self._keys), dtype=dtype)
+            return
+
+        dtype = promote_value_types(self.dtype, dtype)
+        if dtype != self.dtype:
+            self._values = self._values.astype(dtype)
+
+    def _assign(self, pos, value):
+        try:
+            self._values[pos] = value
+        except OverflowError:
+            self._values = self._values.astype(object)
+            self._values[pos] = value
+
+    # Mapping interface
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self._key_at(slice(None)))
+
+    def __contains__(self, key):
+        try:
+            return self._locate(key)[2]
+        except (TypeError, ValueError):
+            return False
+
+    def __getitem__(self, key):
+        _, pos, found = self._locate(key)
+        if not found:
+            raise KeyError(key)
+        return _to_python(self._values[pos])
+
+    def __setitem__(self, key, value):
+        self._materialize()
+        ikey, pos, found = self._locate(key)
+        self._prepare_value(value)
+
+        if found:
+            self._assign(pos, value)
+            return
+
+        size = self._size
+        self._reserve(size + 1)
+        if pos < size:  # insertion in the middle, append otherwise
+            self._keys[pos + 1 : size + 1] = self._keys[pos:size]
+            self._values[pos + 1 : size + 1] = self._values[pos:size]
+        self._keys[pos] = ikey
+        self._assign(pos, value)
+        self._size += 1
+
+    def __delitem__(self, key):
+        _, pos, found = self._locate(key)
+        if not found:
+            raise KeyError(key)
+        self._delete_at(pos)
+
+    def _delete_at(self, index):
+        """Delete the item at position index, or the items of a slice of them."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                raise ValueError("Only contiguous items can be deleted.")
+        else:
+            start = range(self._size)[index]
+            stop = start + 1
+
+        count = stop - start
+        if count <= 0:
+            return
+
+        self._materialize()
+        size = self._size
+        self._keys[start : size - count] = self._keys[stop:size]
+        self._values[start : size - count] = self._values[stop:size]
+        self._size -= count
+
+    def update(self, *args, **kwargs):
+        items = dict(*args, **kwargs)
+        if len(items) <= _MIN_CAPACITY:
+            for key, value in items.items():
+                self[key] = value
+            return
+
+        # Merge all items at once rather than inserting them one by one.
+        keys = np.fromiter(
+            (self._to_int(key) for key in items), dtype=np.int64, count=len(items)
+        )
+        self.extend(keys, list(items.values()))
+
+    def extend(self, keys, values):
+        """Set many values at once, keys being int64 epoch nanoseconds.
+
+        Strictly increasing keys after the last one are appended in place, with
+        amortized capacity. Others are merged, the last value winning on
+        duplicated keys.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        values = to_values_array(values)
+        if len(keys) != len(values):
+            msg = "keys and values should have the same length: {} != {}."
+            raise ValueError(msg.format(len(keys), len(values)))
+        if not len(keys):
+            return
+
+        if values.dtype.kind not in NUMERIC_KINDS:
+            values = values.astype(object)
+        if self._size:
+            values = values.astype(promote_value_types(self.dtype, values.dtype))
+
+        size = self._size
+        is_after = size == 0 or keys[0] > self._keys[size - 1]
+        if not (is_after and (keys[1:] > keys[:-1]).all()):
+            keys, values = _sort_unique(
+                np.concatenate((self.int_keys, keys)),
+                np.concatenate((self.array_values.astype(values.dtype), values)),
+            )
+            self._keys, self._values, self._size = keys, values, len(keys)
+            self._shared = False
+            return
+
+        self._materialize()
+        if self.dtype != values.dtype:
+            self._values = self._values.astype(values.dtype)
+        self._reserve(size + len(keys))
+        self._keys[size : size + len(keys)] = keys
+        self._values[size : size + len(keys)] = values
+        self._size += len(keys)
+
+    def __eq__(self, other):
+        if isinstance(other, ColumnarStore):
+            return np.array_equal(self.int_keys, other.int_keys) and bool(
+                np.all(self.array_values == other.array_values)
+            )
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        items = ", ".join(f"{k!r}: {v!r}" for k, v in self.items())
+        return f"{self.__class__.__name__}({{{items}}})"
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self):
+        return self.range_copy(0, self._size)
+
+    def _range_arrays(self, start, stop, first_key=None):
+        if first_key is None:
+            return self.int_keys[start:stop], self.array_values[start:stop]
+
+        # The previous item is moved onto first_key.
+        keys = np.concatenate(([first_key], self.int_keys[start:stop]))
+        values = self.array_values[start - 1 : stop]
+        return keys, values
+
+    def range_copy(self, start, stop, first_key=None):
+        """Return a new store with the items between positions start and stop.
+
+        Args:
+            start (int): position of the first item.
+            stop (int): position after the last item.
+            first_key (int): if given, the item before start is added back with
+                this key, as epoch nanoseconds.
+        """
+        keys, values = self._range_arrays(start, stop, first_key)
+        return self._from_sorted_arrays(keys.copy(), values.copy(), self.tz)
+
+    def range_view(self, start, stop, first_key=None):
+        """Same as :meth:`range_copy`, but sharing the arrays of this store.
+
+        The values are always shared, the keys are unless first_key is given.
+        Both stores copy the arrays before their first mutation.
+        """
+        keys, values = self._range_arrays(start, stop, first_key)
+        keys.flags.writeable = False
+        values.flags.writeable = False
+
+        self._shared = True
+        return self._from_sorted_arrays(keys, values, self.tz, shared=True)
+
+    def keys(self):
+        return ColumnarKeysView(self)
+
+    def values(self):
+        return ColumnarValuesView(self)
+
+    def items(self):
+        return ColumnarItemsView(self)
+
+    def clear(self):
+        self._keys = np.empty(0, dtype=np.int64)
+        self._values = np.empty(0, dtype=self.dtype)
+        self._size = 0
+        self._shared = False
+
+    # SortedDict interface
+
+    def bisect_left(self, key):
+        return int(np.searchsorted(self.int_keys, self._to_int(key), side="left"))
+
+    def bisect_right(self, key):
+        return int(np.searchsorted(self.int_keys, self._to_int(key), side="right"))
+
+    bisect = bisect_right
+
+    def peekitem(self, index=-1):
+        return self._key_at(index), self._value_at(index)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        start, stop = 0, self._size
+        if minimum is not None:
+            bisect = self.bisect_left if inclusive[0] else self.bisect_right
+            start = bisect(minimum)
+        if maximum is not None:
+            bisect = self.bisect_right if inclusive[1] else self.bisect_left
+            stop = bisect(maximum)
+
+        keys = self._key_at(slice(start, max(start, stop)))
+        return reversed(keys) if reverse else iter(keys)
@@ -0,0 +1,181 @@
+"""Time-partitioned on-disk storage of a TimeSeries.
+
+A store is a directory holding one binary file per period of time (monthly by
+default), named after the start of the period, and a ``meta.json`` file for the meta keys of
+the TimeSeries. Reading a range only loads the partitions intersecting it.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ticts.storage import COLUMNAR, SORTEDDICT, to_datetimeindex
+from ticts.timeseries import DEFAULT_NAME, TimeSeries
+from ticts.utils import MAXTS, MINTS, NO_DEFAULT, timestamp_converter
+
+META_FILENAME = "meta.json"
+PARTITION_SUFFIX = ".bin"
+# Partitions are named after the start of their period, as some periods are
+# written with characters not allowed in file names (e.g. "/" for weeks).
+PARTITION_FORMAT = "%Y-%m-%dT%H-%M-%S"
+
+
+class TimeSeriesStore:
+    """Store a TimeSeries on disk, partitioned by periods of time.
+
+    Args:
+        path (str or Path): directory of the store, created if needed.
+        freq (str): pandas period frequency of the partitions, e.g. "M" or "D".
+            Ignored if the store already exists.
+    """
+
+    def __init__(self, path, freq="M"):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        meta_path = self.path / META_FILENAME
+        if meta_path.exists():
+            self.meta = json.loads(meta_path.read_text())
+        else:
+            self.meta = {"freq": freq}
+
+    def __repr__(self):
+        return f"<TimeSeriesStore path='{self.path}' freq={self.freq}>"
+
+    @property
+    def freq(self):
+        return self.meta["freq"]
+
+    @property
+    def tz(self):
+        return self.meta.get("tz", "UTC")
+
+    @property
+    def partitions(self):
+        """Return the periods of the partitions stored, sorted."""
+        return sorted(
+            pd.Period(pd.to_datetime(path.stem, format=PARTITION_FORMAT), self.freq)
+            for path in self.path.glob(f"*{PARTITION_SUFFIX}")
+        )
+
+    @property
+    def empty(self):
+        return not self.partitions
+
+    @property
+    def upper_bound(self):
+        """Return the upper bound time index."""
+        partitions = self.partitions
+        if not partitions:
+            raise ValueError("The store is empty.")
+        return self._read_partition(partitions[-1]).upper_bound
+
+    def _partition_path(self, period):
+        name = period.start_time.strftime(PARTITION_FORMAT)
+        return self.path / f"{name}{PARTITION_SUFFIX}"
+
+    def _read_partition(self, period):
+        return TimeSeries.from_binary(self._partition_path(period), mmap=True)
+
+    def _write_partition(self, period, keys, values):
+        ts = TimeSeries._from_arrays(keys, values, tz=self.tz, storage=COLUMNAR)
+        ts.to_binary(self._partition_path(period))
+
+    def _period(self, key):
+        return key.tz_convert(self.tz).tz_localize(None).to_period(self.freq)
+
+    def append(self, ts):
+        """Append a TimeSeries after the upper bound of the store.
+
+        Only the partitions ts covers are written: the last partition stored
+        is rewritten if ts starts in it, former ones are left untouched.
+
+        Args:
+            ts (TimeSeries): with numeric or boolean values.
+
+        Raises:
+            ValueError: when ts starts before the upper bound of the store.
+        """
+        if ts.empty:
+            return
+
+        partitions = self.partitions
+        if not partitions:
+            self.meta.update(
+                tz=str(ts.tz),
+                default=ts.default if ts._has_default else "no_default",
+                name=ts.name,
+            )
+            (self.path / META_FILENAME).write_text(json.dumps(self.meta))
+
+        keys, values = ts._as_arrays()
+        if partitions:
+            last = self._read_partition(partitions[-1])
+            if ts.lower_bound <= last.upper_bound:
+                msg = "Can't append from {}, before the upper bound of the store {}."
+                raise ValueError(msg.format(ts.lower_bound, last.upper_bound))
+
+            if self._period(ts.lower_bound) == partitions[-1]:
+                last_keys, last_values = last._as_arrays()
+                keys = np.concatenate((last_keys, keys))
+                values = np.concatenate((last_values, values))
+
+        periods = to_datetimeindex(keys, self.tz).tz_localize(None)
+        periods = periods.to_period(self.freq)
+        splits = np.flatnonzero(periods.asi8[1:] != periods.asi8[:-1]) + 1
+        for lo, hi in zip([0, *splits], [*splits, len(keys)]):
+            self._write_partition(periods[lo], keys[lo:hi], values[lo:hi])
+
+    def read(self, start=None, end=None, storage=None):
+        """Read the TimeSeries on [start, end), loading only the partitions
+        needed.
+
+        The result is the same as reading the whole TimeSeries and slicing it,
+        the value on start being carried over from previous partitions.
+
+        Args:
+            start (datetime or str): lower bound, optional.
+            end (datetime or str): upper bound, optional.
+            storage (str): storage of the TimeSeries, SortedDict by default.
+
+        Returns:
+            TimeSeries
+        """
+        partitions = all_partitions = self.partitions
+        if start is not None:
+            start = timestamp_converter(start, self.tz)
+            first = self._period(start)
+            previous = [period for period in partitions if period < first]
+            partitions = [period for period in partitions if period >= first]
+        if end is not None:
+            end = timestamp_converter(end, self.tz)
+            # The item on start is kept by slice even when end is not after start
+            last = self._period(end if start is None else max(start, end))
+            partitions = [period for period in partitions if period <= last]
+
+        all_ts = [self._read_partition(period) for period in partitions]
+        if start is not None and previous:
+            if not all_ts or all_ts[0].lower_bound > start:
+                all_ts.insert(0, self._read_partition(previous[-1]))
+
+        all_arrays = [ts._as_arrays() for ts in all_ts] or [TimeSeries()._as_arrays()]
+        keys = np.concatenate([keys for keys, _ in all_arrays])
+        values = np.concatenate([values for _, values in all_arrays])
+
+        ts = TimeSeries._from_arrays(
+            keys,
+            values,
+            tz=self.tz,
+            storage=storage or SORTEDDICT,
+            default=self.meta.get("default", NO_DEFAULT),
+            name=self.meta.get("name", DEFAULT_NAME),
+        )
+        if start is None and end is None:
+            return ts
+        if ts.empty and all_partitions:
+            return ts  # all the keys stored are after the range
+        return ts.slice(
+            MINTS if start is None else start, MAXTS if end is None else end
+        )
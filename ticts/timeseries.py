@@ -1,15 +1,37 @@
 import logging
 from copy import deepcopy
+from itertools import compress
 
+import numpy as np
 import pandas as pd
 import pytz
-from sortedcontainers import SortedDict, SortedList
+from sortedcontainers import SortedDict
 
 from ticts.io import TictsIOMixin
 from ticts.iplot import TictsPlot
+from ticts.lazy import LazyTimeSeries
 from ticts.operation import TictsOperationMixin
 from ticts.pandas_mixin import PandasMixin
-from ticts.utils import MAXTS, MINTS, NO_DEFAULT, timestamp_converter
+from ticts.reader import TimeSeriesReader
+from ticts.statistics import TictsStatisticsMixin
+from ticts.storage import (
+    AVAILABLE_STORAGES,
+    COLUMNAR,
+    NUMERIC_KINDS,
+    SORTEDDICT,
+    ColumnarStore,
+    infer_value_dtype,
+    promote_value_types,
+    to_datetimeindex,
+    to_values_array,
+)
+from ticts.utils import (
+    MAXTS,
+    MINTS,
+    NO_DEFAULT,
+    timestamp_converter,
+    timestamps_converter,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +56,77 @@ def _process_args(data, tz):
     return ((timestamp_converter(k, tz), v) for k, v in data)
 
 
+def _process_args_as_arrays(data, tz):
+    """Return epoch nanoseconds keys and values arrays, or None if values
+    can't be stored in a typed array."""
+    if isinstance(data, (list, tuple, set)) and len(data) == 1:
+        data = data[0]
+
+    if isinstance(data, pd.DataFrame):
+        data = data.iloc[:, 0]
+
+    if isinstance(data, pd.Series) and isinstance(data.index, pd.DatetimeIndex):
+        index = data.index
+        if index.tz is None:
+            index = index.tz_localize(tz)
+        keys = index.as_unit("ns").asi8
+        values = data.to_numpy()
+    else:
+        pairs = [(key.value, value) for key, value in _process_args(data, tz)]
+        keys = np.fromiter((key for key, _ in pairs), dtype=np.int64, count=len(pairs))
+        values = to_values_array([value for _, value in pairs])
+
+    if values.ndim != 1 or values.dtype.kind not in NUMERIC_KINDS:
+        return None
+    return keys, values
+
+
+def _build_data(data, tz, storage):
+    if storage not in AVAILABLE_STORAGES:
+        msg = "'{}' storage unknown, should be one of {}."
+        raise ValueError(msg.format(storage, AVAILABLE_STORAGES))
+
+    if storage == COLUMNAR:
+        arrays = _process_args_as_arrays(data, tz)
+        if arrays is not None:
+            return ColumnarStore(*arrays, tz=tz)
+        logger.debug("Values are not numeric, falling back on SortedDict storage.")
+
+    # SortedDict.__init__ does not use the __setitem__
+    # Hence we got to parse datetime keys ourselves.
+    # SortedDict use the first arg given and check if is a callable
+    # in case you want to give your custom sorting function.
+    return SortedDict(None, _process_args(data, tz))
+
+
+def _unpickle_timeseries(cls, keys, values, tz, kwargs):
+    kwargs = dict(kwargs)
+    storage = kwargs.pop("storage")
+    return cls._from_arrays(keys, values, tz=tz, storage=storage, **kwargs)
+
+
+def _get_intervals_bounds(keys, end=None):
+    """Return the bounds of the intervals, as int64 epoch nanoseconds: the keys
+    up to end, and end if it is not a key."""
+    if end is None:
+        return keys
+
+    keys = keys[: np.searchsorted(keys, end, side="right")]
+    if len(keys) and keys[-1] == end:
+        return keys
+    return np.append(keys, end)
+
+
 class TictsMagicMixin:
+    def __reduce__(self):
+        """Pickle keys and values as arrays rather than one pd.Timestamp per key,
+        e.g. to ship TimeSeries to other processes."""
+        keys, values = self._as_arrays()
+        return (
+            _unpickle_timeseries,
+            (self.__class__, keys, values, str(self.tz), self._kwargs_special_keys),
+        )
+
     def __copy__(self):
         return self.__class__(self)
 
@@ -113,7 +205,12 @@ class TictsMagicMixin:
 
 
 class TimeSeries(
-    TictsMagicMixin, TictsOperationMixin, PandasMixin, TictsIOMixin, TictsPlot
+    TictsMagicMixin,
+    TictsOperationMixin,
+    TictsStatisticsMixin,
+    PandasMixin,
+    TictsIOMixin,
+    TictsPlot,
 ):
     """TimeSeries object.
 
@@ -122,6 +219,10 @@ class TimeSeries(
         permissive (bool): Whether to allow accessing non-existing values or not.
             If is True, getting non existing item returns None.
             If is False, getting non existing item raises.
+        storage (str): storage backend among ["sorteddict", "columnar"].
+            "columnar" keeps keys and values in NumPy arrays and falls back on
+            "sorteddict" when values are not numeric. Default to None, which
+            keeps the storage of data if it is a TimeSeries, else "sorteddict".
     """
 
     _default_interpolate = "previous"
@@ -150,11 +251,17 @@ class TimeSeries(
     def _has_default(self):
         return self.default != NO_DEFAULT
 
+    @property
+    def storage(self):
+        """Return the storage backend of the data."""
+        return COLUMNAR if isinstance(self.data, ColumnarStore) else SORTEDDICT
+
     @property
     def _kwargs_special_keys(self):
         kwargs = {}
         for attr_name in self._meta_keys:
             kwargs[attr_name] = getattr(self, attr_name)
+        kwargs["storage"] = self.storage
         return kwargs
 
     @property
@@ -169,6 +276,7 @@ class TimeSeries(
         name=DEFAULT_NAME,
         permissive=True,
         tz="UTC",
+        storage=None,
     ):
         """"""
         if isinstance(data, self.__class__):
@@ -180,6 +288,8 @@ class TimeSeries(
                 setattr(self, "default", default)
             if name != DEFAULT_NAME:
                 setattr(self, "name", name)
+            if storage is not None and storage != self.storage:
+                self.data = _build_data(data.data, data.tz, storage)
             return
 
         if hasattr(default, "lower") and default.lower() == "no_default":
@@ -209,11 +319,10 @@ class TimeSeries(
         except pytz.UnknownTimeZoneError as err:
             raise ValueError(f"{tz} is not a valid timezone") from err
 
-        # SortedDict.__init__ does not use the __setitem__
-        # Hence we got to parse datetime keys ourselves.
-        # SortedDict use the first arg given and check if is a callable
-        # in case you want to give your custom sorting function.
-        self.data = SortedDict(None, _process_args(data, tz))
+        if isinstance(data, ColumnarStore) and storage in (None, COLUMNAR):
+            self.data = data
+        else:
+            self.data = _build_data(data, tz, storage or SORTEDDICT)
 
     def __setitem__(self, key, value):
         if isinstance(key, slice):
@@ -321,12 +430,128 @@ class TimeSeries(
         value = previous_value + coeff * (next_value - previous_value)
         return value
 
-    def slice(self, start, end):  # A003
+    @classmethod
+    def _from_arrays(cls, keys, values, tz="UTC", storage=SORTEDDICT, **kwargs):
+        """Build a TimeSeries from sorted unique int64 epoch nanoseconds keys and
+        values arrays, without converting keys one by one."""
+        ts = cls(**kwargs)
+        if storage == COLUMNAR and values.dtype.kind in NUMERIC_KINDS:
+            ts.data = ColumnarStore(keys, values, tz=tz)
+        else:
+            ts.data = SortedDict(zip(to_datetimeindex(keys, tz), values.tolist()))
+        return ts
+
+    def _as_arrays(self):
+        """Return the keys as int64 epoch nanoseconds and the values as arrays."""
+        if self.storage == COLUMNAR:
+            return self.data.int_keys, self.data.array_values
+
+        keys = np.fromiter(
+            (key.value for key in self.index), dtype=np.int64, count=len(self)
+        )
+        return keys, to_values_array(list(self.values()))
+
+    def _lookup(self, keys, interpolate):
+        """Vectorized lookup of keys given as int64 epoch nanoseconds.
+
+        Returns:
+            tuple of the values found and the mask of keys out of left bound.
+        """
+        if interpolate not in ("previous", "linear"):
+            raise ValueError(f"'{interpolate}' interpolation unknown.")
+
+        if self.empty:
+            # bool is promoted to the dtype of whatever value fills it
+            return np.empty(len(keys), dtype=bool), np.ones(len(keys), dtype=bool)
+
+        index, values = self._as_arrays()
+
+        previous_idx = np.searchsorted(index, keys, side="right") - 1
+        missing = previous_idx < 0
+        previous_idx[missing] = 0
+        result = values[previous_idx]
+
+        if interpolate == "linear":
+            between = (
+                ~missing
+                & (previous_idx + 1 < len(index))
+                & (index[previous_idx] != keys)
+            )
+            if between.any():
+                if values.dtype.kind in "biu":
+                    values = values.astype(np.float64)
+                    result = result.astype(np.float64)
+
+                previous_idx = previous_idx[between]
+                previous_time_idx = index[previous_idx]
+                next_time_idx = index[previous_idx + 1]
+                coeff = (keys[between] - previous_time_idx) / (
+                    next_time_idx - previous_time_idx
+                )
+
+                previous_value = values[previous_idx]
+                next_value = values[previous_idx + 1]
+                result[between] = previous_value + coeff * (next_value - previous_value)
+
+        return result, missing
+
+    def _fill_out_of_left_bound(self, values, missing, keys):
+        """Fill values of keys out of left bound as :meth:`__getitem__` would."""
+        if not missing.any():
+            return values
+
+        if not self._has_default and not self.permissive:
+            key = to_datetimeindex(keys[missing][:1], self.tz)[0]
+            msg = (
+                "Getting {} but default attribute is not set, "
+                "can't deduce value before the oldest measurement"
+            )
+            raise KeyError(msg.format(key))
+
+        fill = self.default if self._has_default else None
+        dtype = promote_value_types(values.dtype, infer_value_dtype(fill))
+        values = values.astype(dtype)
+        values[missing] = fill
+        return values
+
+    def _at(self, keys, interpolate):
+        """:meth:`at` for keys given as int64 epoch nanoseconds."""
+        values, missing = self._lookup(keys, interpolate)
+        return self._fill_out_of_left_bound(values, missing, keys)
+
+    def at(self, keys, interpolate=None, as_series=False):
+        """Get the values of the time series for several keys at once.
+
+        Vectorized equivalent of ``[ts[key, interpolate] for key in keys]``.
+
+        Args:
+            keys (array-like): datetimes index
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the default interpolation.
+            as_series (bool): whether to return a pd.Series indexed by keys.
+
+        Returns:
+            np.ndarray (or pd.Series) of values.
+        """
+        interpolate = (interpolate or self._default_interpolate).lower()
+        keys = timestamps_converter(keys, self.tz)
+
+        values = self._at(keys, interpolate)
+
+        if as_series:
+            index = to_datetimeindex(keys, self.tz)
+            return pd.Series(values, index=index, name=self.name)
+        return values
+
+    def slice(self, start, end, copy=True):  # A003
         """Slice your timeseries for give interval.
 
         Args:
             start (datetime or str): lower bound
             end (datetime or str): upper bound
+            copy (bool): whether to copy the data. If False and the storage is
+                columnar, the TimeSeries returned shares the arrays of this one
+                until either of them is mutated.
 
         Returns:
             TimeSeries sliced
@@ -335,16 +560,74 @@ class TimeSeries(
         end = timestamp_converter(end, self.tz)
 
         newts = TimeSeries(**self._kwargs_special_keys)
+        if self.empty:
+            newts[start] = self[start]
+            return newts
+
+        lo = self.data.bisect_left(start)
+        hi = max(lo, self.data.bisect_left(end))
+        start_is_key = self.data.bisect_right(start) > lo
+        if start_is_key:  # kept even when end is not after start
+            hi = max(hi, lo + 1)
+
+        # Add back the previous value on start if it is not a key and in bounds
+        should_add_left_closure = lo > 0 and not start_is_key
+
+        if self.storage == COLUMNAR:
+            first_key = start.value if should_add_left_closure else None
+            if copy:
+                newts.data = self.data.range_copy(lo, hi, first_key)
+            else:
+                newts.data = self.data.range_view(lo, hi, first_key)
+            return newts
 
-        for key in self.data.irange(start, end, inclusive=(True, False)):
-            newts[key] = self[key]
-
-        should_add_left_closure = start not in newts.index and start >= self.lower_bound
+        keys = self.index[lo:hi]
+        values = self.values()[lo:hi]
         if should_add_left_closure:
-            newts[start] = self[start]  # is applying get_previous on self
+            keys = [start, *keys]
+            values = [self.values()[lo - 1], *values]
+        newts.data = SortedDict(zip(keys, values))
 
         return newts
 
+    def append(self, key, value):
+        """Set a value, with less overhead than ``ts[key] = value`` when key is
+        already a tz-aware timestamp after the upper bound, as in real-time
+        ingestion.
+
+        Args:
+            key (datetime or str): timestamp of the value.
+            value: the value to be set
+        """
+        if not (isinstance(key, pd.Timestamp) and key.tz is not None):
+            key = timestamp_converter(key, self.tz)
+        self.data[key] = value
+
+    def extend(self, keys, values):
+        """Set many values at once, converting all keys in one go.
+
+        With columnar storage, strictly increasing keys after the upper bound
+        are appended in place. Otherwise keys are merged, the last value winning
+        on duplicated keys.
+
+        Args:
+            keys (array-like of datetime or str): timestamps of the values.
+            values (array-like): the values to be set
+
+        Raises:
+            ValueError: when keys and values do not have the same length.
+        """
+        keys = timestamps_converter(keys, self.tz)
+        if len(keys) != len(values):
+            msg = "keys and values should have the same length: {} != {}."
+            raise ValueError(msg.format(len(keys), len(values)))
+
+        if self.storage == COLUMNAR:
+            self.data.extend(keys, values)
+        else:
+            values = values.tolist() if isinstance(values, np.ndarray) else values
+            self.data.update(zip(to_datetimeindex(keys, self.tz), values))
+
     def set_interval(self, start, end, value):
         """Set a value for an interval of time.
 
@@ -366,15 +649,69 @@ class TimeSeries(
         start = timestamp_converter(start, self.tz)
         end = timestamp_converter(end, self.tz)
 
-        keys = self.data.irange(start, end, inclusive=(True, False))
-
         last_value = self[end]
 
-        for key in list(keys):
-            del self.data[key]
+        del self.data.keys()[self.data.bisect_left(start) : self.data.bisect_left(end)]
 
-        self[start] = value
-        self[end] = last_value
+        self.data[start] = value
+        self.data[end] = last_value
+
+    def set_intervals(self, starts, ends, values):
+        """Set values for many non-overlapping intervals of time at once.
+
+        Equivalent to calling :meth:`set_interval` for each interval, in one pass.
+
+        Args:
+            starts (array-like of datetime or str): lower bounds
+            ends (array-like of datetime or str): upper bounds
+            values (array-like): the values to be set
+
+        Raises:
+            NotImplementedError: when no default is set.
+            ValueError: when intervals are empty or overlapping.
+        """
+        if not self._has_default:
+            msg = "At the moment, you have to set a default for set_intervals"
+            raise NotImplementedError(msg)
+
+        starts = timestamps_converter(starts, self.tz)
+        ends = timestamps_converter(ends, self.tz)
+        values = to_values_array(values)
+        if not len(starts) == len(ends) == len(values):
+            msg = "starts, ends and values should have the same length."
+            raise ValueError(msg)
+
+        order = np.argsort(starts, kind="stable")
+        starts, ends, values = starts[order], ends[order], values[order]
+        if (starts >= ends).any() or (ends[:-1] > starts[1:]).any():
+            msg = "Intervals should be non-empty and non-overlapping."
+            raise ValueError(msg)
+
+        # The value on end is restored, unless end is the start of the next interval
+        has_end_marker = np.append(ends[:-1] != starts[1:], True)
+        end_markers = ends[has_end_marker]
+        end_values = self._at(end_markers, "previous")
+
+        if self.storage == COLUMNAR:
+            index, current_values = self._as_arrays()
+            interval_idx = np.searchsorted(starts, index, side="right") - 1
+            is_outside = (interval_idx < 0) | (index >= ends[interval_idx.clip(0)])
+
+            keys = np.concatenate((index[is_outside], starts, end_markers))
+            values = np.concatenate((current_values[is_outside], values, end_values))
+            self.data = ColumnarStore(keys, values, tz=self.data.tz)
+            return
+
+        all_starts = to_datetimeindex(starts, self.tz)
+        all_ends = to_datetimeindex(ends, self.tz)
+        for start, end, value in zip(all_starts, all_ends, values.tolist()):
+            del self.data.keys()[
+                self.data.bisect_left(start) : self.data.bisect_left(end)
+            ]
+            self.data[start] = value
+
+        end_markers = to_datetimeindex(end_markers, self.tz)
+        self.data.update(zip(end_markers, end_values.tolist()))
 
     def _set_slice_with_timeseries(self, start, end, value):
         """Set a slice with a TimeSeries value using overlay semantics.
@@ -394,8 +731,7 @@ class TimeSeries(
         """
         if start == MINTS and end == MAXTS:
             self.data.clear()
-            for ts_key in value.index:
-                self.data[ts_key] = value[ts_key]
+            self.data.update(zip(value.index, value.values()))
             if value._has_default:
                 self.default = value.default
             return
@@ -408,11 +744,11 @@ class TimeSeries(
         )
 
         if end < MAXTS:
-            keys_to_delete = [k for k in self.index if start < k < end]
-            for k in keys_to_delete:
-                del self.data[k]
+            lo, hi = self.data.bisect_right(start), self.data.bisect_left(end)
+            del self.data.keys()[lo:hi]
 
-        has_keys_in_range = any(start <= k < end for k in value.index)
+        value_lo, value_hi = value.data.bisect_left(start), value.data.bisect_left(end)
+        has_keys_in_range = value_hi > value_lo
         should_add_start_marker = (
             value.empty
             or (
@@ -439,46 +775,119 @@ class TimeSeries(
                 else:
                     self.data[start] = None
 
-        for ts_key in value.index:
-            if start <= ts_key < end:
-                self.data[ts_key] = value[ts_key]
+        self.data.update(
+            zip(
+                value.index[value_lo:value_hi],
+                value.values()[value_lo:value_hi],
+            )
+        )
 
         if end < MAXTS and not end_in_index:
             self.data[end] = end_value
 
-    def compact(self):
+    def compact(self, inplace=False):
         """Convert this instance to a compact version: consecutive measurement of the
         same value are discarded.
 
+        Args:
+            inplace (bool): whether to compact this instance instead of a copy.
+
         Returns:
-            TimeSeries
+            TimeSeries, or None if inplace
         """
+        _, values = self._as_arrays()
+
+        # A measurement is kept when its value changes from the previous one.
+        should_keep = np.ones(len(values), dtype=bool)
+        if values.dtype.kind in NUMERIC_KINDS:
+            should_keep[1:] = values[1:] != values[:-1]
+        else:
+            should_keep[1:] = [
+                previous != value for previous, value in zip(values[:-1], values[1:])
+            ]
+
+        if self.storage == COLUMNAR:
+            keys, values = self._as_arrays()
+            data = ColumnarStore(keys[should_keep], values[should_keep], self.data.tz)
+        else:
+            data = SortedDict(compress(self.items(), should_keep))
+
+        if inplace:
+            self.data = data
+            return
+
         ts = TimeSeries(**self._kwargs_special_keys)
-        for time, value in self.items():
-            should_set_it = ts.empty or (ts[time] != value)
-            if should_set_it:
-                ts[time] = value
+        ts.data = data
         return ts
 
+    def reader(self, interpolate=None):
+        """Cursor for sequential reads, faster than :meth:`__getitem__` when
+        keys mostly increase, as in replays.
+
+        Args:
+            interpolate (str): interpolate operator among ["previous", "linear"].
+                Default to None, which result into the default interpolation.
+
+        Returns:
+            TimeSeriesReader
+        """
+        return TimeSeriesReader(self, interpolate)
+
+    def lazy(self):
+        """Start a lazy expression: operators then build an expression tree,
+        evaluated at once with :meth:`~ticts.lazy.LazyTimeSeries.compute`.
+
+        Returns:
+            LazyTimeSeries
+        """
+        return LazyTimeSeries(self)
+
+    def intervals(self, end=None, as_dataframe=False):
+        """Intervals between consecutive keys, as arrays.
+
+        Vectorized equivalent of :meth:`iterintervals`, with the duration of the
+        intervals and the value holding on them.
+
+        Args:
+            end (datetime): right bound of last interval.
+            as_dataframe (bool): whether to return a pd.DataFrame with "start",
+                "end", "duration" and name columns.
+
+        Returns:
+            tuple of the starts and ends (DatetimeIndex), the durations
+            (TimedeltaIndex) and the values (np.ndarray) of the intervals,
+            or a pd.DataFrame.
+        """
+        keys, values = self._as_arrays()
+        if end is not None:
+            end = timestamp_converter(end, self.tz).value
+        bounds = _get_intervals_bounds(keys, end)
+        starts, ends = bounds[:-1], bounds[1:]
+        values = values[: len(starts)]
+
+        durations = pd.TimedeltaIndex((ends - starts).view("m8[ns]"))
+        starts = to_datetimeindex(starts, self.tz)
+        ends = to_datetimeindex(ends, self.tz)
+
+        if as_dataframe:
+            return pd.DataFrame(
+                {
+                    "start": starts,
+                    "end": ends,
+                    "duration": durations,
+                    self.name: values,
+                }
+            )
+        return starts, ends, durations, values
+
     def iterintervals(self, end=None):
         """Iterator that contain start, end of intervals.
 
         Args:
             end (datetime): right bound of last interval.
         """
-        lst_keys = SortedList(self.index)
-        if not end:
-            end = self.upper_bound
-        else:
-            end = timestamp_converter(end, self.tz)
-            if end not in lst_keys:
-                lst_keys.add(end)
-
-        for i, key in enumerate(lst_keys[:-1]):
-            next_key = lst_keys[i + 1]
-            if next_key > end:  # stop there
-                return
-            yield key, next_key
+        starts, ends, _, _ = self.intervals(end or None)
+        yield from zip(starts, ends)
 
     def equals(self, other, check_default=True, check_name=True):
         if not isinstance(other, self.__class__):
@@ -498,19 +907,38 @@ class TimeSeries(
 
     @property
     def tz(self):
+        """Return the timezone of the keys, kept as metadata with columnar
+        storage."""
+        if self.storage == COLUMNAR:
+            return str(self.data.tz)
         if self.empty:
             return pytz.UTC
         return str(self.index[0].tz)
 
     def tz_convert(self, tz):
+        """Convert the keys into another timezone.
+
+        With columnar storage, keys are stored as UTC epoch nanoseconds and the
+        timezone is metadata: the TimeSeries returned shares the arrays of this
+        one until either of them is mutated, whatever its length.
+
+        Args:
+            tz (str): timezone to convert in.
+
+        Returns:
+            TimeSeries
+        """
         try:
             tz = pytz.timezone(tz)
         except pytz.UnknownTimeZoneError as err:
             raise ValueError(f"{tz} is not a valid timezone") from err
 
-        ts = deepcopy(self)
-
-        for key in ts.index:
-            ts[key.tz_convert(tz)] = ts.data.pop(key)
+        ts = TimeSeries(**self._kwargs_special_keys)
+        if self.storage == COLUMNAR:
+            ts.data = self.data.range_view(0, len(self))
+            ts.data.tz = tz
+            return ts
 
+        keys, _ = self._as_arrays()
+        ts.data = SortedDict(zip(to_datetimeindex(keys, tz), self.values()))
         return ts
@@ -1,5 +1,6 @@
 import operator
 
+import numpy as np
 import pandas as pd
 
 
@@ -14,6 +15,29 @@ def timestamp_converter(ts, tz="UTC"):
     return ts
 
 
+def timestamps_converter(keys, tz="UTC"):
+    """Vectorized :func:`timestamp_converter`, returning epoch nanoseconds.
+
+    Args:
+        keys (array-like): datetimes, strings or epochs (as nanoseconds).
+        tz: timezone used to localize naive datetimes.
+
+    Returns:
+        np.ndarray of int64
+    """
+    try:
+        index = pd.DatetimeIndex(keys)
+    except (TypeError, ValueError):
+        # e.g. mixing naive and tz-aware datetimes
+        return np.array(
+            [timestamp_converter(key, tz).value for key in keys], dtype=np.int64
+        )
+
+    if index.tz is None:
+        index = index.tz_localize(tz)
+    return index.as_unit("ns").asi8
+
+
 MINTS = pd.Timestamp.min.tz_localize("UTC")
 MAXTS = pd.Timestamp.max.tz_localize("UTC")
 
@@ -22,6 +46,10 @@ class NoDefault:
     def __repr__(self):
         return "No default"
 
+    def __reduce__(self):
+        # Unpickle as the NO_DEFAULT singleton, compared by identity
+        return "NO_DEFAULT"
+
 
 NO_DEFAULT = NoDefault()
 
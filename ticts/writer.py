@@ -0,0 +1,199 @@
+"""Asynchronous ingestion of measurements into a TimeSeries.
+
+Measurements are buffered, up to a bound, and committed into the TimeSeries
+by batches, each batch being sorted and inserted with one
+:meth:`~ticts.timeseries.TimeSeries.extend`.
+"""
+
+import asyncio
+
+import numpy as np
+
+from ticts.storage import to_datetimeindex, to_values_array
+from ticts.utils import timestamps_converter
+
+
+class AsyncTimeSeriesWriter:
+    """Write (timestamp, value) pairs into a TimeSeries from asyncio code.
+
+    A batch is committed when it holds batch_size measurements, or max_latency
+    seconds after its first measurement. Writing waits while max_pending
+    measurements are waiting for a commit, which applies backpressure to fast
+    producers.
+
+    Example:
+        >>> async with AsyncTimeSeriesWriter(ts) as writer:
+        ...     await writer.consume(measurements)
+
+    Args:
+        ts (TimeSeries): the TimeSeries to write into.
+        batch_size (int): maximum number of measurements per commit.
+        max_latency (float): maximum number of seconds a measurement waits for
+            its commit.
+        max_pending (int): maximum number of measurements waiting for a commit,
+            default to 10 times batch_size.
+    """
+
+    def __init__(self, ts, batch_size=10_000, max_latency=1.0, max_pending=None):
+        if batch_size < 1:
+            raise ValueError(f"batch_size should be positive, got {batch_size}.")
+
+        self.ts = ts
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.max_pending = max_pending or 10 * batch_size
+
+        self._buffer = []
+        self._task = None
+        self._error = None
+        self._flushing = False
+
+    def __repr__(self):
+        return (
+            f"<AsyncTimeSeriesWriter batch_size={self.batch_size}"
+            f" max_latency={self.max_latency} pending={self.pending}>"
+        )
+
+    @property
+    def pending(self):
+        """Number of measurements waiting for a commit."""
+        return len(self._buffer)
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def start(self):
+        """Start committing in the background, within a running event loop."""
+        if self._task is not None:
+            return
+        # Set when a batch is to be started or is full, when there is room in
+        # the buffer and when everything written is committed.
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def _raise_on_error(self):
+        if self._error is not None:
+            raise RuntimeError("A batch failed to be committed.") from self._error
+
+    async def write(self, key, value):
+        """Write a measurement, waiting while too many are pending.
+
+        Args:
+            key (datetime or str): timestamp of the value.
+            value: the value to be set
+
+        Raises:
+            RuntimeError: when a former batch failed to be committed.
+        """
+        self._raise_on_error()
+        if self._task is None:
+            self.start()
+
+        while len(self._buffer) >= self.max_pending:
+            self._space.clear()
+            await self._space.wait()
+            self._raise_on_error()
+
+        self._buffer.append((key, value))
+        self._idle.clear()
+        if len(self._buffer) == 1 or len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def consume(self, pairs):
+        """Write all the measurements of an (async) iterable.
+
+        Args:
+            pairs (async iterable or iterable): (timestamp, value) pairs.
+        """
+        if hasattr(pairs, "__aiter__"):
+            async for key, value in pairs:
+                await self.write(key, value)
+        else:
+            for key, value in pairs:
+                await self.write(key, value)
+
+    async def flush(self):
+        """Commit the measurements written without waiting for max_latency.
+
+        Raises:
+            RuntimeError: when a batch failed to be committed.
+        """
+        if self._task is not None:
+            self._flushing = True
+            self._wakeup.set()
+            try:
+                await self._idle.wait()
+            finally:
+                self._flushing = False
+        self._raise_on_error()
+
+    async def close(self):
+        """Commit the pending measurements and stop committing.
+
+        Raises:
+            RuntimeError: when a batch failed to be committed.
+        """
+        if self._task is None:
+            return
+        try:
+            await self.flush()
+        finally:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _commit(self, batch):
+        keys = timestamps_converter([key for key, _ in batch], self.ts.tz)
+        values = to_values_array([value for _, value in batch])
+
+        # Sorted keys are appended in place, the last value written winning.
+        # Keys are passed tz-aware, extend localizing naive ones in ts.tz.
+        order = np.argsort(keys, kind="stable")
+        self.ts.extend(to_datetimeindex(keys[order], self.ts.tz), values[order])
+
+    async def _wait_for_batch(self):
+        """Wait until the buffer holds a full batch, max_latency is elapsed or
+        a flush is requested."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_latency
+
+        while len(self._buffer) < self.batch_size and not self._flushing:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            await self._wait_for_batch()
+
+            batch = self._buffer[: self.batch_size]
+            del self._buffer[: self.batch_size]
+            try:
+                if batch and self._error is None:
+                    self._commit(batch)
+            except Exception as err:
+                self._error = err
+
+            self._space.set()
+            if self._buffer and self._error is None:
+                self._wakeup.set()
+            else:
+                self._buffer.clear()
+                self._wakeup.clear()
+                self._idle.set()